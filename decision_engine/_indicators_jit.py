@@ -0,0 +1,71 @@
+"""Numba kernel for build_indicators' numeric core.
+
+compute_indicators takes the NaN-free float64 tails build_indicators already
+cuts (the last 200 prices and last 20 volumes) and derives every indicator in
+plain loops. Without numba those loops would run interpreted and lose to the
+numpy slices, so build_indicators only routes here when NUMBA_AVAILABLE, and
+only imports this module on its first call.
+
+The kernel is compiled with numba's numpy error model: a zero price yields
+inf/NaN returns exactly like the numpy path (and build_indicators then
+returns None) instead of raising ZeroDivisionError.
+"""
+from __future__ import annotations
+
+import math
+
+from decision_engine._njit import njit
+
+
+@njit(cache=True, error_model="numpy")
+def compute_indicators(prices, volumes, ma_windows, volatility_window, drawdown_window):
+    """
+    Return (ma_20, ma_50, ma_60, ma_100, ma_200, volatility_20d,
+    volume_avg_20d, drawdown_6m); drawdown_6m is NaN when the peak is 0.
+
+    ma_windows is the ascending five-window tuple indicators._MA_WINDOWS.
+    The windows are required arguments: numba dispatch on omitted defaults
+    costs more than the kernel itself.
+    """
+    window_0, window_1, window_2, window_3, window_4 = ma_windows
+    n = len(prices)
+    latest = prices[n - 1]
+    total = 0.0
+    ma_0 = ma_1 = ma_2 = ma_3 = ma_4 = math.nan
+    peak = -math.inf
+    # Walk backwards so every moving average is a prefix sum of the same loop.
+    for k in range(n):
+        price = prices[n - 1 - k]
+        total += price
+        count = k + 1
+        if count <= drawdown_window and price > peak:
+            peak = price
+        if count == window_0:
+            ma_0 = total / window_0
+        elif count == window_1:
+            ma_1 = total / window_1
+        elif count == window_2:
+            ma_2 = total / window_2
+        elif count == window_3:
+            ma_3 = total / window_3
+        elif count == window_4:
+            ma_4 = total / window_4
+
+    start = n - volatility_window
+    mean = 0.0
+    for i in range(start, n):
+        mean += prices[i] / prices[i - 1] - 1
+    mean /= volatility_window
+    squares = 0.0
+    for i in range(start, n):
+        deviation = prices[i] / prices[i - 1] - 1 - mean
+        squares += deviation * deviation
+    volatility = math.sqrt(squares / (volatility_window - 1))
+
+    volume_total = 0.0
+    for i in range(len(volumes)):
+        volume_total += volumes[i]
+    volume_avg = volume_total / len(volumes)
+
+    drawdown = latest / peak - 1 if peak != 0 else math.nan
+    return ma_0, ma_1, ma_2, ma_3, ma_4, volatility, volume_avg, drawdown
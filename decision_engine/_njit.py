@@ -0,0 +1,22 @@
+"""Optional Numba JIT support with a pure-Python fallback."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        # Support both bare @njit and @njit(parallel=True, cache=True).
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
@@ -0,0 +1,144 @@
+"""Compile the gate chain into a single generated Python function.
+
+Each gate exposes ``to_ast()`` returning the expression that triggers its
+non-PASS decision, written against the names ``market``, ``stock`` and
+``regime``. compile_gates stitches those expressions, the gates' decisions
+and messages into one function so evaluation skips per-gate dispatch,
+GateResult allocation and the interpreted loop in DecisionEngine.
+"""
+from __future__ import annotations
+
+import ast
+import functools
+from typing import Any, Callable, List, Optional, Sequence
+
+from decision_engine.models import GateDecision, MarketRegime, MarketSnapshot, StockSnapshot
+
+CompiledGates = Callable[[MarketSnapshot, StockSnapshot, MarketRegime, List[str]], GateDecision]
+
+_NAMESPACE = {
+    "_PASS": GateDecision.PASS,
+    "_WAIT": GateDecision.WAIT,
+    "_REJECT": GateDecision.REJECT,
+    **{f"_{regime.name}": regime for regime in MarketRegime},
+}
+
+
+def field(owner: str, attr: str) -> ast.expr:
+    return ast.Attribute(value=ast.Name(id=owner, ctx=ast.Load()), attr=attr, ctx=ast.Load())
+
+
+def constant(value: Any) -> ast.expr:
+    return ast.Constant(value=value)
+
+
+def compare(left: ast.expr, op: ast.cmpop, right: ast.expr) -> ast.expr:
+    return ast.Compare(left=left, ops=[op], comparators=[right])
+
+
+def regime_is(regime: MarketRegime) -> ast.expr:
+    return compare(ast.Name(id="regime", ctx=ast.Load()), ast.Eq(), ast.Name(id=f"_{regime.name}", ctx=ast.Load()))
+
+
+def _append(message: str) -> ast.stmt:
+    call = ast.Call(
+        func=ast.Attribute(value=ast.Name(id="reason_log", ctx=ast.Load()), attr="append", ctx=ast.Load()),
+        args=[constant(message)],
+        keywords=[],
+    )
+    return ast.Expr(value=call)
+
+
+def _gate_statement(gate: Any) -> ast.stmt:
+    if gate.fail_decision == GateDecision.REJECT:
+        on_fail: ast.stmt = ast.Return(value=ast.Name(id="_REJECT", ctx=ast.Load()))
+    else:
+        on_fail = ast.Assign(
+            targets=[ast.Name(id="decision", ctx=ast.Store())],
+            value=ast.Name(id="_WAIT", ctx=ast.Load()),
+        )
+    return ast.If(
+        test=gate.to_ast(),
+        body=[_append(gate.fail_message), on_fail],
+        orelse=[_append(gate.pass_message)],
+    )
+
+
+def _compilable(gate: Any) -> bool:
+    # to_ast() must describe the evaluate() that actually runs: a subclass
+    # overriding only one of them would otherwise be compiled from its
+    # parent's logic.
+    for klass in type(gate).__mro__:
+        attrs = vars(klass)
+        if "evaluate" in attrs or "to_ast" in attrs:
+            return "evaluate" in attrs and "to_ast" in attrs
+    return False
+
+
+# Types compile() accepts inside ast.Constant; anything else (numpy scalars,
+# Decimal, ...) is bound as a name in the generated function's namespace.
+_LITERAL_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+class _BindConstants(ast.NodeTransformer):
+    def __init__(self, namespace: dict) -> None:
+        self.namespace = namespace
+
+    def visit_Constant(self, node: ast.Constant) -> ast.expr:
+        if type(node.value) in _LITERAL_TYPES:
+            return node
+        name = f"_const_{len(self.namespace)}"
+        self.namespace[name] = node.value
+        return ast.Name(id=name, ctx=ast.Load())
+
+
+def _build(gates: Sequence[Any]) -> Optional[CompiledGates]:
+    if not all(_compilable(gate) for gate in gates):
+        return None
+    body: list[ast.stmt] = [
+        ast.Assign(targets=[ast.Name(id="decision", ctx=ast.Store())], value=ast.Name(id="_PASS", ctx=ast.Load()))
+    ]
+    body.extend(_gate_statement(gate) for gate in gates)
+    body.append(ast.Return(value=ast.Name(id="decision", ctx=ast.Load())))
+    function = ast.FunctionDef(
+        name="compiled_gates",
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=name) for name in ("market", "stock", "regime", "reason_log")],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=body,
+        decorator_list=[],
+        returns=None,
+    )
+    namespace = dict(_NAMESPACE)
+    module = _BindConstants(namespace).visit(ast.Module(body=[function], type_ignores=[]))
+    try:
+        code = compile(ast.fix_missing_locations(module), "<decision_engine.compiled_gates>", "exec")
+    except (TypeError, ValueError, SyntaxError):
+        # A to_ast() the compiler rejects leaves the chain to the interpreter.
+        return None
+    exec(code, namespace)
+    return namespace["compiled_gates"]
+
+
+_build_cached = functools.lru_cache(maxsize=32)(_build)
+
+
+def compile_gates(gates: Sequence[Any]) -> Optional[CompiledGates]:
+    """
+    Return a compiled gate chain, or None when a gate has no to_ast(),
+    overrides evaluate() without its own to_ast(), or builds an expression
+    that does not compile.
+
+    Frozen-dataclass gates are hashable, so identical gate configurations
+    share one compiled function.
+    """
+    key = tuple(gates)
+    try:
+        hash(key)
+    except TypeError:
+        return _build(key)
+    return _build_cached(key)
@@ -1,12 +1,54 @@
+"""Data sources for live market inputs."""
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+import datetime as dt
+import functools
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
 
+_OHLCV_CACHE_SIZE = 4096
+_BATCH_SIZE = 20
+_ohlcv_cache: OrderedDict[tuple[str, int, str], Any] = OrderedDict()
+_ohlcv_cache_lock = threading.Lock()
+_pruned_cache_dirs: set[tuple[str, str]] = set()
+_pruned_cache_dirs_lock = threading.Lock()
 
-def _default_downloader(ticker: str, period: str, interval: str) -> Any:
+# Yahoo symbols: letters/digits plus the ., -, ^, = and & used for share
+# classes, exchange suffixes, indices, FX pairs and names like M&M.NS
+# (BRK-B, 005930.KS, ^GSPC, EURUSD=X).
+_TICKER_RE = re.compile(r"[A-Z0-9^][A-Z0-9.\-^=&]{0,19}")
+_DISK_CACHE_SUBDIR = "ohlcv"
+_DISK_CACHE_FILE_RE = re.compile(r".+_\d+y_(\d{4}-\d{2}-\d{2})\.pkl")
+
+
+def is_valid_ticker(ticker: str) -> bool:
+    return _TICKER_RE.fullmatch(ticker) is not None
+
+
+@functools.cache
+def _get_yf() -> Any:
     import yfinance as yf
 
-    return yf.download(ticker, period=period, interval=interval, auto_adjust=False, progress=False)
+    return yf
+
+
+def _default_downloader(ticker: str, period: str, interval: str) -> Any:
+    return _get_yf().download(ticker, period=period, interval=interval, auto_adjust=False, progress=False)
+
+
+def _default_batch_downloader(tickers: str, period: str, interval: str) -> Any:
+    return _get_yf().download(
+        tickers,
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        threads=True,
+        auto_adjust=False,
+        progress=False,
+    )
 
 
 def fetch_ohlcv(
@@ -23,3 +65,197 @@ def fetch_ohlcv(
     if data is None or getattr(data, "empty", True):
         return None
     return data
+
+
+def _cache_key(ticker: str, years: int) -> tuple[str, int, str]:
+    return ticker.upper(), years, dt.date.today().isoformat()
+
+
+def _disk_cache_root(cache_dir: str) -> str:
+    # Pickles live in a subdirectory of their own, so pruning never touches
+    # files the user keeps in cache_dir itself.
+    return os.path.realpath(os.path.join(os.path.expanduser(cache_dir), _DISK_CACHE_SUBDIR))
+
+
+def _disk_cache_path(cache_dir: str, key: tuple[str, int, str]) -> Optional[str]:
+    """Pickle path for key under cache_dir, or None when the ticker is unsafe."""
+    ticker, years, day = key
+    if not is_valid_ticker(ticker):
+        return None
+    root = _disk_cache_root(cache_dir)
+    path = os.path.realpath(os.path.join(root, f"{ticker}_{years}y_{day}.pkl"))
+    # Never read or write outside the cache subdirectory, e.g. through a
+    # symlinked entry.
+    if os.path.dirname(path) != root:
+        return None
+    return path
+
+
+def _prune_disk_cache(cache_dir: str, today: str) -> None:
+    """Delete pickles from earlier days; runs once per directory per day."""
+    root = _disk_cache_root(cache_dir)
+    with _pruned_cache_dirs_lock:
+        if (root, today) in _pruned_cache_dirs:
+            return
+        _pruned_cache_dirs.add((root, today))
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return
+    for name in names:
+        match = _DISK_CACHE_FILE_RE.fullmatch(name)
+        if match is not None and match.group(1) != today:
+            try:
+                os.remove(os.path.join(root, name))
+            except OSError:
+                pass
+
+
+def _read_disk_cache(path: Optional[str]) -> Optional[Any]:
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        import pandas as pd
+
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+
+def _write_disk_cache(cache_dir: str, path: Optional[str], data: Any) -> None:
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data.to_pickle(path)
+    except Exception:
+        return
+    _prune_disk_cache(cache_dir, dt.date.today().isoformat())
+
+
+def _remember(key: tuple[str, int, str], data: Any) -> None:
+    with _ohlcv_cache_lock:
+        _ohlcv_cache[key] = data
+        _ohlcv_cache.move_to_end(key)
+        while len(_ohlcv_cache) > _OHLCV_CACHE_SIZE:
+            _ohlcv_cache.popitem(last=False)
+
+
+def fetch_ohlcv_cached(
+    ticker: str,
+    years: int = 5,
+    cache_dir: str | None = None,
+    refresh: bool = False,
+) -> Optional[Any]:
+    """
+    Memoized fetch_ohlcv keyed by (ticker, years, trading day).
+
+    The key includes today's date, so an intraday fetch expires naturally the
+    next day. Failed fetches are not cached. When cache_dir is given (e.g.
+    "~/.cache/decision_engine") frames are also pickled under its "ohlcv"
+    subdirectory and reused across processes; pickles from earlier days are
+    deleted from that subdirectory only. refresh=True skips both caches and replaces
+    their entries with a fresh download.
+    """
+    key = _cache_key(ticker, years)
+    if not refresh:
+        with _ohlcv_cache_lock:
+            data = _ohlcv_cache.get(key)
+            if data is not None:
+                _ohlcv_cache.move_to_end(key)
+                return data
+
+    path = _disk_cache_path(cache_dir, key) if cache_dir else None
+    data = _read_disk_cache(path) if path and not refresh else None
+    if data is None:
+        data = fetch_ohlcv(ticker, years)
+        if data is None:
+            return None
+        if path:
+            _write_disk_cache(cache_dir, path, data)
+    _remember(key, data)
+    return data
+
+
+def _slice_ticker(data: Any, ticker: str, single: bool) -> Optional[Any]:
+    columns = getattr(data, "columns", None)
+    if getattr(columns, "nlevels", 1) > 1:
+        if ticker not in columns.get_level_values(0):
+            return None
+        frame = data[ticker]
+    elif single:
+        frame = data
+    else:
+        return None
+    # Multi-ticker frames share one index; drop dates this ticker did not trade.
+    frame = frame.dropna(how="all")
+    if frame.empty:
+        return None
+    return frame
+
+
+def fetch_ohlcv_many(
+    tickers: list[str],
+    years: int = 5,
+    downloader: Callable[[str, str, str], Any] | None = None,
+    cache_dir: str | None = None,
+    refresh: Iterable[str] = (),
+) -> dict[str, Any]:
+    """
+    Fetch daily OHLCV for many tickers with one request per 20-ticker chunk.
+
+    Tickers already memoized by fetch_ohlcv_cached are served from memory and
+    fresh frames are added to that memo. cache_dir is shared with
+    fetch_ohlcv_cached, so frames pickled by an earlier run are not
+    downloaded again. Tickers in refresh skip both caches and are downloaded
+    again; their old memo entry is dropped first, so one missing from the
+    batch is refetched by fetch_ohlcv_cached instead of served stale.
+    Tickers whose download fails are left out of the result.
+    """
+    period = f"{years}y"
+    download = downloader or _default_batch_downloader
+    stale = {ticker.upper() for ticker in refresh}
+    results: dict[str, Any] = {}
+    pending: list[str] = []
+    for ticker in dict.fromkeys(ticker.upper() for ticker in tickers):
+        key = _cache_key(ticker, years)
+        if ticker in stale:
+            with _ohlcv_cache_lock:
+                _ohlcv_cache.pop(key, None)
+            pending.append(ticker)
+            continue
+        with _ohlcv_cache_lock:
+            cached = _ohlcv_cache.get(key)
+        if cached is None and cache_dir:
+            cached = _read_disk_cache(_disk_cache_path(cache_dir, key))
+            if cached is not None:
+                _remember(key, cached)
+        if cached is not None:
+            results[ticker] = cached
+        else:
+            pending.append(ticker)
+
+    for start in range(0, len(pending), _BATCH_SIZE):
+        chunk = pending[start : start + _BATCH_SIZE]
+        try:
+            data = download(" ".join(chunk), period, "1d")
+        except Exception:
+            continue
+        if data is None or getattr(data, "empty", True):
+            continue
+        for ticker in chunk:
+            frame = _slice_ticker(data, ticker, single=len(chunk) == 1)
+            if frame is not None:
+                key = _cache_key(ticker, years)
+                results[ticker] = frame
+                _remember(key, frame)
+                if cache_dir:
+                    _write_disk_cache(cache_dir, _disk_cache_path(cache_dir, key), frame)
+    return results
+
+
+def clear_ohlcv_cache() -> None:
+    with _ohlcv_cache_lock:
+        _ohlcv_cache.clear()
+    with _pruned_cache_dirs_lock:
+        _pruned_cache_dirs.clear()
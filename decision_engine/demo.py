@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 from decision_engine.engine import DecisionEngine
 from decision_engine.models import MarketSnapshot, PortfolioConstraints, StockSnapshot
 from decision_engine.rules import (
@@ -21,38 +23,43 @@ from decision_engine.rules import (
 )
 
 
+# The rule graph is immutable (frozen dataclass rules), so it is built once
+# per process and shared by every engine build_engine() returns. Gates run
+# cheapest first by cost_hint; since later gate messages win in scan's WAIT
+# summary, this order also decides which reason a multi-gate WAIT reports.
+_GATES = tuple(
+    sorted(
+        (LiquidityGate(), VolatilityGate(), RegimeMismatchGate(), EventRiskGate(), BusinessClarityGate()),
+        key=lambda gate: gate.cost_hint,
+    )
+)
+_CLASSIFICATION_RULES = (TrendPullbackRule(), MeanReversionRule(), DefensiveIncomeRule())
+_ENTRY_RULES = {
+    rule.candidate_type(): entry_rule
+    for rule, entry_rule in zip(
+        _CLASSIFICATION_RULES,
+        (TrendPullbackEntryRule(), MeanReversionEntryRule(), DefensiveIncomeEntryRule()),
+    )
+}
+
+
 def build_engine() -> DecisionEngine:
-    regime_rule = RegimeRule()
-    gates = [
-        LiquidityGate(),
-        VolatilityGate(),
-        RegimeMismatchGate(),
-        EventRiskGate(),
-        BusinessClarityGate(),
-    ]
-    classifier = Classifier([TrendPullbackRule(), MeanReversionRule(), DefensiveIncomeRule()])
-    entry_evaluator = EntryEvaluator(
-        {
-            TrendPullbackRule().candidate_type(): TrendPullbackEntryRule(),
-            MeanReversionRule().candidate_type(): MeanReversionEntryRule(),
-            DefensiveIncomeRule().candidate_type(): DefensiveIncomeEntryRule(),
-        }
+    return DecisionEngine(
+        RegimeRule(),
+        list(_GATES),
+        Classifier(list(_CLASSIFICATION_RULES)),
+        EntryEvaluator(dict(_ENTRY_RULES)),
+        PositionSizer(),
     )
-    position_sizer = PositionSizer()
-    return DecisionEngine(regime_rule, gates, classifier, entry_evaluator, position_sizer)
 
 
 def print_report(title: str, report) -> None:
-    print("=" * 60)
-    print(title)
-    print("(1) Decision")
-    print(report.decision.value)
-    print("(2) Reason Log")
-    for item in report.reason_log:
-        print(f"- {item}")
-    print("(3) Action Plan")
-    for item in report.action_plan:
-        print(f"- {item}")
+    lines = ["=" * 60, title, "(1) Decision", report.decision.value, "(2) Reason Log"]
+    lines.extend(f"- {item}" for item in report.reason_log)
+    lines.append("(3) Action Plan")
+    lines.extend(f"- {item}" for item in report.action_plan)
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 def main() -> None:
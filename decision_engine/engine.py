@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Any, Iterable, List
 
+from decision_engine.compile import compile_gates
 from decision_engine.models import (
     CandidateType,
     DecisionReport,
@@ -11,13 +12,57 @@ from decision_engine.models import (
     MarketSnapshot,
     PortfolioConstraints,
     StockSnapshot,
+    StockSnapshotBatch,
 )
 from decision_engine.rules import (
+    BusinessClarityGate,
     Classifier,
+    DefensiveIncomeEntryRule,
+    DefensiveIncomeRule,
     EntryEvaluator,
+    EventRiskGate,
+    LiquidityGate,
+    MeanReversionEntryRule,
+    MeanReversionRule,
     PositionSizer,
+    RegimeMismatchGate,
     RegimeRule,
     RuleResult,
+    TrendPullbackEntryRule,
+    TrendPullbackRule,
+    VolatilityGate,
+)
+
+# The rule set engine_numba's kernel mirrors; evaluate_batch refuses any
+# other configuration rather than return results evaluate() would not.
+_BATCH_GATE_TYPES = {
+    LiquidityGate,
+    VolatilityGate,
+    RegimeMismatchGate,
+    EventRiskGate,
+    BusinessClarityGate,
+}
+_BATCH_CLASSIFICATION_TYPES = {TrendPullbackRule, MeanReversionRule, DefensiveIncomeRule}
+_BATCH_ENTRY_TYPES = {
+    CandidateType.TREND_PULLBACK: TrendPullbackEntryRule,
+    CandidateType.MEAN_REVERSION: MeanReversionEntryRule,
+    CandidateType.DEFENSIVE_INCOME: DefensiveIncomeEntryRule,
+}
+
+_ENTRY_PLAN_LINES = {
+    EntryDecision.ENTRY_ALLOWED: (
+        "1차 진입 조건 충족 시 1트랜치 매수.",
+        "추가 진입은 동일 조건 재확인 후 분할 매수.",
+    ),
+    EntryDecision.WAIT_FOR_CONFIRMATION: (
+        "1차 진입 조건 미충족으로 확인 전까지 대기.",
+        "거래량/이동평균 조건 재확인 후 진입.",
+    ),
+    EntryDecision.NO_ENTRY: ("진입 조건이 충족되지 않아 신규 매수 중단.",),
+}
+_PLAN_FOOTER = (
+    "무효화 조건: 변동성 급등 또는 레짐 악화 시 신규 매수 중단.",
+    "금지 사항: 단일 지표 기반 매수, 감정적 판단.",
 )
 
 
@@ -31,7 +76,11 @@ class DecisionEngine:
         position_sizer: PositionSizer,
     ) -> None:
         self.regime_rule = regime_rule
+        # Gates run in the caller's order; demo.build_engine() passes its
+        # default chain already sorted by GateRule.cost_hint.
         self.gates = list(gates)
+        # None when a gate has no to_ast(); evaluate() then interprets the chain.
+        self._compiled_gates = compile_gates(self.gates)
         self.classifier = classifier
         self.entry_evaluator = entry_evaluator
         self.position_sizer = position_sizer
@@ -42,21 +91,21 @@ class DecisionEngine:
         stock: StockSnapshot,
         constraints: PortfolioConstraints,
     ) -> DecisionReport:
-        reason_log: List[str] = []
-        action_plan: List[str] = []
-
         regime, regime_result = self.regime_rule.evaluate(market)
-        reason_log.append(regime_result.message)
+        reason_log: List[str] = [regime_result.message]
 
-        gate_decision = GateDecision.PASS
-        for gate in self.gates:
-            result = gate.evaluate(market, stock, regime)
-            reason_log.append(result.message)
-            if result.decision == GateDecision.REJECT:
-                gate_decision = GateDecision.REJECT
-                break
-            if result.decision == GateDecision.WAIT:
-                gate_decision = GateDecision.WAIT
+        if self._compiled_gates is not None:
+            gate_decision = self._compiled_gates(market, stock, regime, reason_log)
+        else:
+            gate_decision = GateDecision.PASS
+            for gate in self.gates:
+                result = gate.evaluate(market, stock, regime)
+                reason_log.append(result.message)
+                if result.decision == GateDecision.REJECT:
+                    gate_decision = GateDecision.REJECT
+                    break
+                if result.decision == GateDecision.WAIT:
+                    gate_decision = GateDecision.WAIT
 
         if gate_decision == GateDecision.REJECT:
             return DecisionReport(FinalDecision.REJECT, reason_log, ["신규 매수 금지."])
@@ -73,13 +122,74 @@ class DecisionEngine:
         reason_log.extend(entry_result.messages)
 
         position_plan = self.position_sizer.size(stock, constraints)
-        action_plan.extend(position_plan.messages)
-
-        action_plan.extend(self._build_action_plan(classification.candidate_type, entry_result.decision, position_plan))
+        action_plan = list(position_plan.messages)
+        self._build_action_plan(classification.candidate_type, entry_result.decision, position_plan, action_plan)
 
         final_decision = self._final_decision(entry_result.decision)
         return DecisionReport(final_decision, reason_log, action_plan)
 
+    def evaluate_batch(
+        self,
+        market: MarketSnapshot,
+        batch: StockSnapshotBatch,
+        constraints: PortfolioConstraints,
+    ) -> tuple[Any, Any, Any]:
+        """
+        Screen a columnar batch with the engine_numba kernel.
+
+        Returns (decision_code, candidate_code, max_position_pct) arrays; codes
+        index into engine_numba.DECISIONS / engine_numba.CANDIDATE_TYPES.
+        Only the default rule set is supported, with its liquidity and
+        volatility thresholds configurable; any other configuration raises
+        ValueError.
+        """
+        from decision_engine import engine_numba
+
+        if not self._supports_batch():
+            raise ValueError("evaluate_batch는 기본 규칙 구성에서만 지원됩니다.")
+        params = {}
+        for gate in self.gates:
+            if isinstance(gate, LiquidityGate):
+                params["min_avg_volume"] = float(gate.min_avg_volume)
+            elif isinstance(gate, VolatilityGate):
+                params["max_volatility"] = float(gate.max_volatility)
+
+        return engine_numba.evaluate_batch(
+            batch.price,
+            batch.ma_50,
+            batch.ma_200,
+            batch.drawdown_6m,
+            batch.volatility_annual,
+            batch.avg_volume,
+            batch.volume,
+            batch.dividend_yield,
+            batch.flags,
+            float(market.index_price),
+            float(market.index_ma_200),
+            float(market.vix),
+            market.rate_trend_up,
+            params["min_avg_volume"],
+            params["max_volatility"],
+            float(constraints.max_position_pct),
+            float(constraints.target_volatility),
+        )
+
+    def _supports_batch(self) -> bool:
+        # Exact types: a subclass may override the logic the kernel mirrors.
+        classification_rules = self.classifier.rules
+        return (
+            type(self.regime_rule) is RegimeRule
+            and len(self.gates) == len(_BATCH_GATE_TYPES)
+            and {type(gate) for gate in self.gates} == _BATCH_GATE_TYPES
+            and type(self.classifier) is Classifier
+            and len(classification_rules) == len(_BATCH_CLASSIFICATION_TYPES)
+            and {type(rule) for rule in classification_rules} == _BATCH_CLASSIFICATION_TYPES
+            and type(self.entry_evaluator) is EntryEvaluator
+            and {candidate: type(rule) for candidate, rule in self.entry_evaluator.rules.items()}
+            == _BATCH_ENTRY_TYPES
+            and type(self.position_sizer) is PositionSizer
+        )
+
     def _final_decision(self, entry_decision: EntryDecision) -> FinalDecision:
         if entry_decision == EntryDecision.ENTRY_ALLOWED:
             return FinalDecision.APPROVE
@@ -92,18 +202,9 @@ class DecisionEngine:
         candidate_type: CandidateType,
         entry_decision: EntryDecision,
         position_plan,
-    ) -> List[str]:
-        plan: List[str] = []
+        plan: List[str],
+    ) -> None:
         plan.append(f"후보 유형: {candidate_type.value}.")
-        if entry_decision == EntryDecision.ENTRY_ALLOWED:
-            plan.append("1차 진입 조건 충족 시 1트랜치 매수.")
-            plan.append("추가 진입은 동일 조건 재확인 후 분할 매수.")
-        elif entry_decision == EntryDecision.WAIT_FOR_CONFIRMATION:
-            plan.append("1차 진입 조건 미충족으로 확인 전까지 대기.")
-            plan.append("거래량/이동평균 조건 재확인 후 진입.")
-        else:
-            plan.append("진입 조건이 충족되지 않아 신규 매수 중단.")
+        plan.extend(_ENTRY_PLAN_LINES[entry_decision])
         plan.append(f"비중 상한: {position_plan.max_position_pct:.2%}.")
-        plan.append("무효화 조건: 변동성 급등 또는 레짐 악화 시 신규 매수 중단.")
-        plan.append("금지 사항: 단일 지표 기반 매수, 감정적 판단.")
-        return plan
+        plan.extend(_PLAN_FOOTER)
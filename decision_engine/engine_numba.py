@@ -0,0 +1,128 @@
+"""Batch evaluation kernel for screening many tickers at once.
+
+The kernel mirrors RegimeRule, the default gates, the three classification
+rules, their entry rules and PositionSizer on structure-of-arrays inputs and
+returns integer codes only. Reason/Action messages are not produced here;
+resolve them with DecisionEngine.evaluate for the rows that are printed.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from decision_engine._njit import njit, prange
+from decision_engine.models import (
+    BUSINESS_CLARITY,
+    EARNINGS_RISK,
+    REGULATORY_RISK,
+    SECTOR_DEFENSIVE,
+    CandidateType,
+    FinalDecision,
+    MarketRegime,
+)
+
+# Code tables: decision/candidate/regime codes index into these tuples.
+DECISIONS = (FinalDecision.APPROVE, FinalDecision.WAIT, FinalDecision.REJECT)
+CANDIDATE_TYPES = (
+    CandidateType.TREND_PULLBACK,
+    CandidateType.MEAN_REVERSION,
+    CandidateType.DEFENSIVE_INCOME,
+)
+REGIMES = (MarketRegime.RISK_ON, MarketRegime.NEUTRAL, MarketRegime.RISK_OFF)
+NO_CANDIDATE = -1
+
+_APPROVE = 0
+_WAIT = 1
+_REJECT = 2
+_TREND_PULLBACK = 0
+_MEAN_REVERSION = 1
+_DEFENSIVE_INCOME = 2
+_RISK_ON = 0
+_NEUTRAL = 1
+_RISK_OFF = 2
+
+
+@njit(cache=True)
+def classify_regime_code(index_price: float, index_ma200: float, vix: float) -> int:
+    if index_price > index_ma200 and vix < 20:
+        return _RISK_ON
+    if index_price < index_ma200 and vix > 25:
+        return _RISK_OFF
+    return _NEUTRAL
+
+
+@njit(parallel=True, cache=True)
+def evaluate_batch(
+    price,
+    ma50,
+    ma200,
+    dd6m,
+    vol_ann,
+    avg_vol,
+    vol,
+    div_yield,
+    flags_bits,
+    index_price,
+    index_ma200,
+    vix,
+    rate_up,
+    min_avg_volume=200000.0,
+    max_volatility=0.45,
+    max_position_pct=0.08,
+    target_volatility=0.2,
+):
+    """Return (decision_code, candidate_code, max_position_pct) arrays."""
+    n = price.shape[0]
+    decision_code = np.empty(n, dtype=np.int8)
+    candidate_code = np.empty(n, dtype=np.int8)
+    position_pct = np.zeros(n, dtype=np.float64)
+    regime = classify_regime_code(index_price, index_ma200, vix)
+
+    for i in prange(n):
+        flags = flags_bits[i]
+        candidate_code[i] = NO_CANDIDATE
+
+        # Gates: any REJECT wins regardless of order, otherwise any WAIT.
+        reject = (
+            avg_vol[i] < min_avg_volume
+            or (regime == _RISK_OFF and (flags & SECTOR_DEFENSIVE) == 0)
+            or (flags & BUSINESS_CLARITY) == 0
+        )
+        if reject:
+            decision_code[i] = _REJECT
+            continue
+        if vol_ann[i] > max_volatility or (flags & (EARNINGS_RISK | REGULATORY_RISK)) != 0:
+            decision_code[i] = _WAIT
+            continue
+
+        # Classification: DEFENSIVE_INCOME > TREND_PULLBACK > MEAN_REVERSION.
+        p = price[i]
+        price_to_ma200 = p / ma200[i] if ma200[i] != 0 else 0.0
+        ma50_distance = abs(p - ma50[i]) / ma50[i] if ma50[i] != 0 else 0.0
+        volume_ratio = vol[i] / avg_vol[i] if avg_vol[i] != 0 else 0.0
+        defensive = (
+            dd6m[i] >= -0.15
+            and vol_ann[i] <= 0.25
+            and price_to_ma200 >= 0.97 - 1e-6
+            and price_to_ma200 <= 1.12 + 1e-6
+            and ma50_distance <= 0.08
+            and volume_ratio <= 1.5
+        )
+        if defensive:
+            candidate = _DEFENSIVE_INCOME
+            entry_ok = p > ma200[i]
+        elif p > ma200[i] and dd6m[i] <= -0.05 and dd6m[i] >= -0.2:
+            candidate = _TREND_PULLBACK
+            entry_ok = p > ma50[i] and vol[i] >= avg_vol[i] * 1.2
+        elif dd6m[i] <= -0.3 and p < ma200[i]:
+            candidate = _MEAN_REVERSION
+            entry_ok = p > ma50[i] and vol[i] >= avg_vol[i] * 1.3
+        else:
+            decision_code[i] = _WAIT
+            continue
+
+        candidate_code[i] = candidate
+        decision_code[i] = _APPROVE if entry_ok else _WAIT
+        volatility = max(vol_ann[i], 0.01)
+        position_pct[i] = min(max_position_pct, max_position_pct * (target_volatility / volatility))
+
+    return decision_code, candidate_code, position_pct
@@ -1,10 +1,54 @@
 from __future__ import annotations
 
+import functools
+import math
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 
-@dataclass(frozen=True)
+_MA_WINDOWS = (20, 50, 60, 100, 200)
+_VOLUME_WINDOW = 20
+_VOLATILITY_WINDOW = 20
+_DRAWDOWN_WINDOW = 126
+_RESYNC_INTERVAL = 10000
+_INDICATOR_CACHE_SIZE = 256
+
+_indicator_cache: OrderedDict[tuple, tuple[Any, Optional[IndicatorSnapshot]]] = OrderedDict()
+_indicator_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _get_np() -> Any:
+    import numpy as np
+
+    return np
+
+
+@functools.cache
+def _get_pd() -> Any:
+    # Only live-mode indicator building needs pandas; importing it lazily keeps
+    # sample-mode CLI start-up free of the numpy/pandas import cost.
+    import pandas as pd
+
+    return pd
+
+
+@functools.cache
+def _get_indicator_kernel() -> Any:
+    # Importing numba costs far more than the kernel saves on a short run, so
+    # it is only resolved once build_indicators actually runs.
+    from decision_engine._njit import NUMBA_AVAILABLE
+
+    if not NUMBA_AVAILABLE:
+        return _indicator_values
+    from decision_engine._indicators_jit import compute_indicators
+
+    return compute_indicators
+
+
+@dataclass(frozen=True, slots=True)
 class IndicatorSnapshot:
     price_column: str
     latest_price: float
@@ -21,24 +65,28 @@ class IndicatorSnapshot:
 
 
 def _select_price_column(data: Any, use_adjusted_close: bool) -> Optional[str]:
-    if use_adjusted_close and "Adj Close" in getattr(data, "columns", []):
+    columns = getattr(data, "columns", ())
+    # MultiIndex membership matches on the first level; keep that behaviour.
+    if getattr(columns, "nlevels", 1) > 1:
+        columns = columns.get_level_values(0)
+    labels = set(columns)
+    if use_adjusted_close and "Adj Close" in labels:
         return "Adj Close"
-    if "Close" in getattr(data, "columns", []):
+    if "Close" in labels:
         return "Close"
-    if "Adj Close" in getattr(data, "columns", []):
+    if "Adj Close" in labels:
         return "Adj Close"
     return None
 
 
-def _calculate_drawdown(prices: Any, window: int = 126) -> Optional[float]:
-    # prices: pandas Series expected
+def _calculate_drawdown(prices: Any, window: int = _DRAWDOWN_WINDOW) -> Optional[float]:
+    # prices: float64 ndarray expected
     if prices is None or len(prices) < window:
         return None
-    window_prices = prices.iloc[-window:]
-    peak = window_prices.max()
-    if peak is None or peak == 0:
+    peak = prices[-window:].max()
+    if peak == 0:
         return None
-    return float(prices.iloc[-1] / peak - 1)
+    return float(prices[-1] / peak - 1)
 
 
 def _to_series(x: Any):
@@ -46,11 +94,10 @@ def _to_series(x: Any):
     yfinance/pandas sometimes return a 1-col DataFrame (or weird slices).
     Convert that into a Series safely.
     """
-    import pandas as pd
-
     if x is None:
         return None
 
+    pd = _get_pd()
     if isinstance(x, pd.Series):
         return x
 
@@ -69,39 +116,52 @@ def _to_series(x: Any):
     return None
 
 
-def _is_missing_bool(v: Any) -> bool:
-    """
-    Convert pd.Series/pd.DataFrame any()-style results into a plain bool.
+def _clean_tail(values: Any, size: int) -> Any:
     """
-    import pandas as pd
+    Last `size` non-NaN values, same as values.dropna()[-size:].
 
-    if v is None:
-        return True
-
-    # if it's already bool-like
-    if isinstance(v, (bool, int)):
-        return bool(v)
-
-    # Series -> reduce
-    if isinstance(v, pd.Series):
-        return bool(v.any())
-
-    # DataFrame -> reduce twice
-    if isinstance(v, pd.DataFrame):
-        return bool(v.any().any())
-
-    # fallback: try to coerce
-    try:
-        return bool(v)
-    except Exception:
-        return True
+    The common case has no gaps in the tail, so only that slice is scanned;
+    the full-length NaN filter runs only when the tail actually has gaps.
+    """
+    np = _get_np()
+    tail = values[-size:]
+    if len(tail) == size and not np.isnan(tail).any():
+        return tail
+    return values[~np.isnan(values)][-size:]
+
+
+def _indicator_values(
+    prices: Any,
+    volumes: Any,
+    ma_windows: tuple[int, ...],
+    volatility_window: int,
+    drawdown_window: int,
+) -> tuple[float, ...]:
+    """numpy counterpart of _indicators_jit.compute_indicators."""
+    np = _get_np()
+    tail = prices[-(volatility_window + 1):]
+    # A zero price yields inf/NaN returns, which build_indicators rejects.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(tail) / tail[:-1]
+        volatility = returns.std(ddof=1)
+    drawdown_6m = _calculate_drawdown(prices, drawdown_window)
+    return (
+        *(prices[-window:].mean() for window in ma_windows),
+        volatility,
+        volumes.mean(),
+        math.nan if drawdown_6m is None else drawdown_6m,
+    )
 
 
 def build_indicators(
     data: Any,
     use_adjusted_close: bool = False,
 ) -> Optional[IndicatorSnapshot]:
-    import pandas as pd
+    try:
+        _get_pd()
+        np = _get_np()
+    except ImportError as exc:
+        raise ImportError("build_indicators requires pandas and numpy") from exc
 
     # Basic column validation
     price_column = _select_price_column(data, use_adjusted_close)
@@ -117,71 +177,36 @@ def build_indicators(
     if prices is None or volumes is None:
         return None
 
-    # Clean NaNs
-    prices = prices.dropna()
-    volumes = volumes.dropna()
+    # Squeeze to float64 buffers once; everything below works on the raw
+    # arrays, and only the last 200 prices / 20 volumes are ever needed.
+    p = _clean_tail(prices.to_numpy(dtype=np.float64, copy=False), _MA_WINDOWS[-1])
+    v = _clean_tail(volumes.to_numpy(dtype=np.float64, copy=False), _VOLUME_WINDOW)
 
     # Need enough history
-    if len(prices) < 200 or len(volumes) < 20:
+    if len(p) < _MA_WINDOWS[-1] or len(v) < _VOLUME_WINDOW:
         return None
 
-    # Use recent windows for "completeness" checks
-    price_window = prices.iloc[-200:]
-    volume_window = volumes.iloc[-20:]
-
-    missing_price = price_window.isna().any()
-    missing_volume = volume_window.isna().any()
-
-    if _is_missing_bool(missing_price) or _is_missing_bool(missing_volume):
-        return None
-
-    # Moving averages
-    ma_20 = prices.rolling(window=20).mean().iloc[-1]
-    ma_50 = prices.rolling(window=50).mean().iloc[-1]
-    ma_60 = prices.rolling(window=60).mean().iloc[-1]
-    ma_100 = prices.rolling(window=100).mean().iloc[-1]
-    ma_200 = prices.rolling(window=200).mean().iloc[-1]
-
-    # Volatility (20d std of pct_change)
-    returns = prices.pct_change()
-    volatility_20d = returns.rolling(window=20).std().iloc[-1]
+    # Moving averages, 20-day return volatility, volume average and 6-month
+    # drawdown (NaN when the peak is 0) in one call.
+    compute = _get_indicator_kernel()
+    ma_20, ma_50, ma_60, ma_100, ma_200, volatility_20d, volume_avg_20d, drawdown_6m = compute(
+        p, v, _MA_WINDOWS, _VOLATILITY_WINDOW, _DRAWDOWN_WINDOW
+    )
 
     # Volume features
-    volume_avg_20d = volumes.rolling(window=20).mean().iloc[-1]
-    latest_volume = volumes.iloc[-1]
-
-    # IMPORTANT: do not do `if volume_avg_20d` on pandas scalars
-    if pd.isna(volume_avg_20d) or float(volume_avg_20d) == 0.0:
-        volume_change_ratio = None
-    else:
-        volume_change_ratio = float(latest_volume) / float(volume_avg_20d)
-
-    # Drawdown (6 months ~ 126 trading days)
-    drawdown_6m = _calculate_drawdown(prices)
-
-    # Final completeness check (must be all real numbers; allow ratio None only if avg==0)
-    values = [
-        ma_20,
-        ma_50,
-        ma_60,
-        ma_100,
-        ma_200,
-        volatility_20d,
-        volume_avg_20d,
-        latest_volume,
-        drawdown_6m,
-    ]
-
-    if any(pd.isna(v) for v in values):
+    latest_volume = v[-1]
+    if volume_avg_20d == 0.0:
         return None
+    volume_change_ratio = latest_volume / volume_avg_20d
 
-    # If ratio still None here, treat as incomplete (keep strict)
-    if volume_change_ratio is None:
+    # Final completeness check (must be all real numbers)
+    values = (ma_20, ma_50, ma_60, ma_100, ma_200, volatility_20d, volume_change_ratio, drawdown_6m)
+    if np.isnan(values).any():
         return None
 
     return IndicatorSnapshot(
         price_column=str(price_column),
-        latest_price=float(prices.iloc[-1]),
+        latest_price=float(p[-1]),
         latest_volume=float(latest_volume),
         ma_20=float(ma_20),
         ma_50=float(ma_50),
@@ -193,3 +218,161 @@ def build_indicators(
         volume_change_ratio=float(volume_change_ratio),
         drawdown_6m=float(drawdown_6m),
     )
+
+
+def build_indicators_cached(
+    data: Any,
+    use_adjusted_close: bool = False,
+) -> Optional[IndicatorSnapshot]:
+    """
+    Memoized build_indicators for repeated calls on the same DataFrame object.
+
+    Entries are keyed by object identity, row count and last index value, and
+    keep a reference to the frame so its id() cannot be reused while cached.
+    Frames mutated in place without changing length or last row are not
+    detected.
+    """
+    index = getattr(data, "index", None)
+    if index is None:
+        return build_indicators(data, use_adjusted_close=use_adjusted_close)
+    key = (id(data), use_adjusted_close, len(index), index[-1] if len(index) else None)
+    with _indicator_cache_lock:
+        entry = _indicator_cache.get(key)
+        if entry is not None and entry[0] is data:
+            _indicator_cache.move_to_end(key)
+            return entry[1]
+
+    result = build_indicators(data, use_adjusted_close=use_adjusted_close)
+    with _indicator_cache_lock:
+        _indicator_cache[key] = (data, result)
+        _indicator_cache.move_to_end(key)
+        while len(_indicator_cache) > _INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
+    return result
+
+
+def clear_indicator_cache() -> None:
+    with _indicator_cache_lock:
+        _indicator_cache.clear()
+
+
+class IndicatorStream:
+    """
+    Incrementally maintained indicators for live/backtest loops.
+
+    build_indicators is used for the cold start; afterwards each new bar is
+    folded in with O(1) work: moving averages keep running sums
+    (MA_w(t) = MA_w(t-1) + (S[t] - S[t-w]) / w), the 20-day return volatility
+    keeps running sums of returns and squared returns, and the 6-month peak is
+    tracked with a monotonic deque. NaN bars are skipped like dropna() does.
+    """
+
+    def __init__(
+        self,
+        prices: Iterable[float] = (),
+        volumes: Iterable[float] = (),
+        price_column: str = "Close",
+    ) -> None:
+        self.price_column = price_column
+        self._prices: deque[float] = deque(maxlen=_MA_WINDOWS[-1])
+        self._price_sums = dict.fromkeys(_MA_WINDOWS, 0.0)
+        self._returns: deque[float] = deque(maxlen=_VOLATILITY_WINDOW)
+        self._return_sum = 0.0
+        self._return_sq_sum = 0.0
+        self._volumes: deque[float] = deque(maxlen=_VOLUME_WINDOW)
+        self._volume_sum = 0.0
+        self._peaks: deque[tuple[int, float]] = deque()
+        self._count = 0
+        for price in prices:
+            self.push_price(price)
+        for volume in volumes:
+            self.push_volume(volume)
+
+    def push_price(self, price: float) -> None:
+        price = float(price)
+        if math.isnan(price):
+            return
+        prices = self._prices
+        for window in _MA_WINDOWS:
+            if len(prices) >= window:
+                self._price_sums[window] -= prices[-window]
+            self._price_sums[window] += price
+        if prices:
+            previous = prices[-1]
+            self._push_return(price / previous - 1 if previous else math.nan)
+        prices.append(price)
+
+        index = self._count
+        self._count += 1
+        peaks = self._peaks
+        while peaks and peaks[-1][1] <= price:
+            peaks.pop()
+        peaks.append((index, price))
+        if peaks[0][0] <= index - _DRAWDOWN_WINDOW:
+            peaks.popleft()
+
+        # Running sums drift with floating point error; resync occasionally.
+        if self._count % _RESYNC_INTERVAL == 0:
+            history = list(prices)
+            for window in _MA_WINDOWS:
+                self._price_sums[window] = math.fsum(history[-window:])
+            self._volume_sum = math.fsum(self._volumes)
+
+    def push_volume(self, volume: float) -> None:
+        volume = float(volume)
+        if math.isnan(volume):
+            return
+        volumes = self._volumes
+        if len(volumes) == volumes.maxlen:
+            self._volume_sum -= volumes[0]
+        volumes.append(volume)
+        self._volume_sum += volume
+
+    def push(self, price: float, volume: float) -> Optional[IndicatorSnapshot]:
+        self.push_price(price)
+        self.push_volume(volume)
+        return self.snapshot()
+
+    def _push_return(self, value: float) -> None:
+        returns = self._returns
+        if len(returns) == returns.maxlen:
+            dropped = returns[0]
+            self._return_sum -= dropped
+            self._return_sq_sum -= dropped * dropped
+        returns.append(value)
+        self._return_sum += value
+        self._return_sq_sum += value * value
+        if not math.isfinite(self._return_sum):
+            # A non-finite return poisons the running sums; rebuild from the window.
+            self._return_sum = math.fsum(returns)
+            self._return_sq_sum = math.fsum(item * item for item in returns)
+
+    def snapshot(self) -> Optional[IndicatorSnapshot]:
+        if len(self._prices) < _MA_WINDOWS[-1] or len(self._volumes) < _VOLUME_WINDOW:
+            return None
+
+        n = len(self._returns)
+        variance = (self._return_sq_sum - self._return_sum * self._return_sum / n) / (n - 1)
+        volatility_20d = math.sqrt(max(variance, 0.0))
+        volume_avg_20d = self._volume_sum / _VOLUME_WINDOW
+        peak = self._peaks[0][1]
+        if not math.isfinite(volatility_20d) or volume_avg_20d == 0.0 or peak == 0.0:
+            return None
+
+        latest_price = self._prices[-1]
+        latest_volume = self._volumes[-1]
+        ma_20, ma_50, ma_60, ma_100, ma_200 = (self._price_sums[window] / window for window in _MA_WINDOWS)
+        return IndicatorSnapshot(
+            price_column=self.price_column,
+            latest_price=latest_price,
+            latest_volume=latest_volume,
+            ma_20=ma_20,
+            ma_50=ma_50,
+            ma_60=ma_60,
+            ma_100=ma_100,
+            ma_200=ma_200,
+            volatility_20d=volatility_20d,
+            volume_avg_20d=volume_avg_20d,
+            volume_change_ratio=latest_volume / volume_avg_20d,
+            drawdown_6m=latest_price / peak - 1,
+        )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import Any, List, Sequence
+
+# Bit positions for packing StockSnapshot's boolean fields into one integer.
+EARNINGS_RISK = 1 << 0
+REGULATORY_RISK = 1 << 1
+BUSINESS_CLARITY = 1 << 2
+SECTOR_DEFENSIVE = 1 << 3
 
 
 class MarketRegime(str, Enum):
@@ -35,7 +41,7 @@ class FinalDecision(str, Enum):
     REJECT = "REJECT"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketSnapshot:
     index_price: float
     index_ma_200: float
@@ -43,7 +49,7 @@ class MarketSnapshot:
     rate_trend_up: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockSnapshot:
     ticker: str
     price: float
@@ -58,9 +64,67 @@ class StockSnapshot:
     regulatory_risk: bool
     business_clarity: bool
     sector_defensive: bool
-
-
-@dataclass(frozen=True)
+    flags: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "flags", pack_flags(self))
+
+
+def pack_flags(stock: StockSnapshot) -> int:
+    flags = 0
+    if stock.earnings_risk:
+        flags |= EARNINGS_RISK
+    if stock.regulatory_risk:
+        flags |= REGULATORY_RISK
+    if stock.business_clarity:
+        flags |= BUSINESS_CLARITY
+    if stock.sector_defensive:
+        flags |= SECTOR_DEFENSIVE
+    return flags
+
+
+@dataclass(frozen=True, slots=True)
+class StockSnapshotBatch:
+    """Columnar view of many StockSnapshots (one numpy array per field)."""
+
+    ticker: Any
+    price: Any
+    avg_volume: Any
+    volume: Any
+    volatility_annual: Any
+    ma_50: Any
+    ma_200: Any
+    drawdown_6m: Any
+    dividend_yield: Any
+    flags: Any
+
+    def __len__(self) -> int:
+        return len(self.ticker)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[StockSnapshot]) -> StockSnapshotBatch:
+        import numpy as np
+
+        count = len(rows)
+
+        def column(name: str):
+            return np.fromiter((getattr(row, name) for row in rows), dtype=np.float64, count=count)
+
+        return cls(
+            ticker=np.array([row.ticker for row in rows], dtype=object),
+            price=column("price"),
+            avg_volume=column("avg_volume"),
+            volume=column("volume"),
+            volatility_annual=column("volatility_annual"),
+            ma_50=column("ma_50"),
+            ma_200=column("ma_200"),
+            drawdown_6m=column("drawdown_6m"),
+            dividend_yield=column("dividend_yield"),
+            flags=np.fromiter((row.flags for row in rows), dtype=np.uint8, count=count),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioConstraints:
     max_position_pct: float
     tranche_count: int
@@ -68,33 +132,33 @@ class PortfolioConstraints:
     target_volatility: float = 0.2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleResult:
     name: str
     passed: bool
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateResult:
     name: str
     decision: GateDecision
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassificationResult:
     candidate_type: CandidateType | None
     messages: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntryResult:
     decision: EntryDecision
     messages: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionPlan:
     max_position_pct: float
     tranche_pct: float
@@ -102,7 +166,7 @@ class PositionPlan:
     messages: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecisionReport:
     decision: FinalDecision
     reason_log: List[str]
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import ast
+import logging
 from dataclasses import dataclass
 from typing import List
 
+from decision_engine.compile import compare, constant, field, regime_is
 from decision_engine.models import (
+    EARNINGS_RISK,
+    REGULATORY_RISK,
     CandidateType,
     ClassificationResult,
     EntryDecision,
@@ -18,6 +23,42 @@ from decision_engine.models import (
     StockSnapshot,
 )
 
+_LOG = logging.getLogger(__name__)
+
+_EVENT_RISK_FLAGS = EARNINGS_RISK | REGULATORY_RISK
+
+# Constant reason-log messages, shared by every evaluation.
+_MSG = {
+    "regime_risk_on": "지수는 장기 이동평균 위이며 변동성 지표가 낮아 RISK_ON으로 분류됨.",
+    "regime_risk_off": "지수는 장기 이동평균 아래이고 변동성 지표가 높아 RISK_OFF으로 분류됨.",
+    "regime_neutral": "지수와 변동성 지표가 혼재되어 NEUTRAL로 분류됨.",
+    "liquidity_fail": "평균 거래량이 기준치 미만이라 유동성 부족으로 즉시 거절.",
+    "liquidity_pass": "유동성 기준 통과.",
+    "volatility_fail": "연율 변동성이 높아 과도한 변동성으로 보류.",
+    "volatility_pass": "변동성 기준 통과.",
+    "regime_mismatch_fail": "RISK_OFF 환경에서 방어형 섹터가 아니라 레짐 불일치로 거절.",
+    "regime_mismatch_pass": "레짐 정합성 통과.",
+    "event_risk_fail": "실적/규제 이벤트 리스크가 있어 신규 진입 보류.",
+    "event_risk_pass": "이벤트 리스크 없음.",
+    "business_clarity_fail": "사업 구조가 명확하지 않아 설명 불가능한 비즈니스로 거절.",
+    "business_clarity_pass": "비즈니스 구조 명확.",
+    "trend_pullback_pass": "장기 추세 위에서 5~20% 눌림 구간.",
+    "trend_pullback_fail": "추세 눌림 조건 불충족.",
+    "mean_reversion_pass": "과도한 하락 구간에서 평균회귀 후보.",
+    "mean_reversion_fail": "과도한 하락 조건 불충족.",
+    "defensive_income_pass": "완만한 6개월 낙폭, 낮은 변동성, 200MA 근처 안정, 단기 과열 없음.",
+    "defensive_income_fail": "방어형 가격/변동성 안정 조건 불충족.",
+    "trend_pullback_entry_pass": "50일선 회복과 거래량 증가 확인.",
+    "trend_pullback_entry_fail": "지지/거래량 확인 필요.",
+    "mean_reversion_entry_pass": "단기 반등 신호와 거래량 급증 확인.",
+    "mean_reversion_entry_fail": "반등 구조 확인 필요.",
+    "defensive_income_entry_pass": "장기 이동평균 위에서 방어형 유지.",
+    "defensive_income_entry_fail": "장기 추세 회복 확인 필요.",
+    "defensive_priority": "복수 후보 중 DEFENSIVE_INCOME 우선 규칙 적용.",
+    "no_candidate": "후보 유형을 결정할 수 없음.",
+    "position_scaled": "변동성에 따라 최대 비중을 축소 적용.",
+}
+
 
 class RegimeRule:
     name = "market_regime"
@@ -25,108 +66,157 @@ class RegimeRule:
     def evaluate(self, market: MarketSnapshot) -> tuple[MarketRegime, RuleResult]:
         if market.index_price > market.index_ma_200 and market.vix < 20:
             regime = MarketRegime.RISK_ON
-            message = "지수는 장기 이동평균 위이며 변동성 지표가 낮아 RISK_ON으로 분류됨."
+            message = _MSG["regime_risk_on"]
         elif market.index_price < market.index_ma_200 and market.vix > 25:
             regime = MarketRegime.RISK_OFF
-            message = "지수는 장기 이동평균 아래이고 변동성 지표가 높아 RISK_OFF으로 분류됨."
+            message = _MSG["regime_risk_off"]
         else:
             regime = MarketRegime.NEUTRAL
-            message = "지수와 변동성 지표가 혼재되어 NEUTRAL로 분류됨."
+            message = _MSG["regime_neutral"]
         return regime, RuleResult(self.name, True, message)
 
 
+def classify_regime_vectorized(index_price, index_ma_200, vix):
+    """
+    Classify many market days at once with RegimeRule's thresholds.
+
+    Returns a uint8 array of codes indexing engine_numba.REGIMES
+    (0=RISK_ON, 1=NEUTRAL, 2=RISK_OFF).
+    """
+    import numpy as np
+
+    index_price = np.asarray(index_price, dtype=np.float64)
+    index_ma_200 = np.asarray(index_ma_200, dtype=np.float64)
+    vix = np.asarray(vix, dtype=np.float64)
+    codes = np.ones(index_price.shape, dtype=np.uint8)
+    codes[(index_price > index_ma_200) & (vix < 20)] = 0
+    codes[(index_price < index_ma_200) & (vix > 25)] = 2
+    return codes
+
+
 class GateRule:
+    __slots__ = ()
     name = "gate"
+    # Lower runs first in the default chain (demo._GATES): cheap checks that
+    # reject most often lead it. DecisionEngine itself keeps caller order.
+    cost_hint = 100
+    fail_decision = GateDecision.REJECT
+    fail_message = ""
+    pass_message = ""
 
     def evaluate(self, market: MarketSnapshot, stock: StockSnapshot, regime: MarketRegime) -> GateResult:
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiquidityGate(GateRule):
     min_avg_volume: float = 200000
     name: str = "liquidity_gate"
+    cost_hint = 10
+    fail_decision = GateDecision.REJECT
+    fail_message = _MSG["liquidity_fail"]
+    pass_message = _MSG["liquidity_pass"]
 
     def evaluate(self, market: MarketSnapshot, stock: StockSnapshot, regime: MarketRegime) -> GateResult:
         if stock.avg_volume < self.min_avg_volume:
-            return GateResult(
-                self.name,
-                GateDecision.REJECT,
-                "평균 거래량이 기준치 미만이라 유동성 부족으로 즉시 거절.",
-            )
-        return GateResult(self.name, GateDecision.PASS, "유동성 기준 통과.")
+            return GateResult(self.name, self.fail_decision, self.fail_message)
+        return GateResult(self.name, GateDecision.PASS, self.pass_message)
 
+    def to_ast(self) -> ast.expr:
+        return compare(field("stock", "avg_volume"), ast.Lt(), constant(self.min_avg_volume))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class VolatilityGate(GateRule):
     max_volatility: float = 0.45
     name: str = "volatility_gate"
+    cost_hint = 40
+    fail_decision = GateDecision.WAIT
+    fail_message = _MSG["volatility_fail"]
+    pass_message = _MSG["volatility_pass"]
 
     def evaluate(self, market: MarketSnapshot, stock: StockSnapshot, regime: MarketRegime) -> GateResult:
         if stock.volatility_annual > self.max_volatility:
-            return GateResult(
-                self.name,
-                GateDecision.WAIT,
-                "연율 변동성이 높아 과도한 변동성으로 보류.",
-            )
-        return GateResult(self.name, GateDecision.PASS, "변동성 기준 통과.")
+            return GateResult(self.name, self.fail_decision, self.fail_message)
+        return GateResult(self.name, GateDecision.PASS, self.pass_message)
+
+    def to_ast(self) -> ast.expr:
+        return compare(field("stock", "volatility_annual"), ast.Gt(), constant(self.max_volatility))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegimeMismatchGate(GateRule):
     name: str = "regime_mismatch_gate"
+    cost_hint = 50
+    fail_decision = GateDecision.REJECT
+    fail_message = _MSG["regime_mismatch_fail"]
+    pass_message = _MSG["regime_mismatch_pass"]
 
     def evaluate(self, market: MarketSnapshot, stock: StockSnapshot, regime: MarketRegime) -> GateResult:
         if regime == MarketRegime.RISK_OFF and not stock.sector_defensive:
-            return GateResult(
-                self.name,
-                GateDecision.REJECT,
-                "RISK_OFF 환경에서 방어형 섹터가 아니라 레짐 불일치로 거절.",
-            )
-        return GateResult(self.name, GateDecision.PASS, "레짐 정합성 통과.")
+            return GateResult(self.name, self.fail_decision, self.fail_message)
+        return GateResult(self.name, GateDecision.PASS, self.pass_message)
+
+    def to_ast(self) -> ast.expr:
+        return ast.BoolOp(
+            op=ast.And(),
+            values=[
+                regime_is(MarketRegime.RISK_OFF),
+                ast.UnaryOp(op=ast.Not(), operand=field("stock", "sector_defensive")),
+            ],
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventRiskGate(GateRule):
     name: str = "event_risk_gate"
+    cost_hint = 30
+    fail_decision = GateDecision.WAIT
+    fail_message = _MSG["event_risk_fail"]
+    pass_message = _MSG["event_risk_pass"]
 
     def evaluate(self, market: MarketSnapshot, stock: StockSnapshot, regime: MarketRegime) -> GateResult:
-        if stock.earnings_risk or stock.regulatory_risk:
-            return GateResult(
-                self.name,
-                GateDecision.WAIT,
-                "실적/규제 이벤트 리스크가 있어 신규 진입 보류.",
-            )
-        return GateResult(self.name, GateDecision.PASS, "이벤트 리스크 없음.")
+        if stock.flags & _EVENT_RISK_FLAGS:
+            return GateResult(self.name, self.fail_decision, self.fail_message)
+        return GateResult(self.name, GateDecision.PASS, self.pass_message)
 
+    def to_ast(self) -> ast.expr:
+        return ast.BinOp(left=field("stock", "flags"), op=ast.BitAnd(), right=constant(_EVENT_RISK_FLAGS))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BusinessClarityGate(GateRule):
     name: str = "business_clarity_gate"
+    cost_hint = 20
+    fail_decision = GateDecision.REJECT
+    fail_message = _MSG["business_clarity_fail"]
+    pass_message = _MSG["business_clarity_pass"]
 
     def evaluate(self, market: MarketSnapshot, stock: StockSnapshot, regime: MarketRegime) -> GateResult:
         if not stock.business_clarity:
-            return GateResult(
-                self.name,
-                GateDecision.REJECT,
-                "사업 구조가 명확하지 않아 설명 불가능한 비즈니스로 거절.",
-            )
-        return GateResult(self.name, GateDecision.PASS, "비즈니스 구조 명확.")
+            return GateResult(self.name, self.fail_decision, self.fail_message)
+        return GateResult(self.name, GateDecision.PASS, self.pass_message)
+
+    def to_ast(self) -> ast.expr:
+        return ast.UnaryOp(op=ast.Not(), operand=field("stock", "business_clarity"))
 
 
 class ClassificationRule:
+    __slots__ = ()
     name = "classification"
+    _candidate_type: CandidateType
 
     def evaluate(self, stock: StockSnapshot, regime: MarketRegime) -> RuleResult:
         raise NotImplementedError
 
     def candidate_type(self) -> CandidateType:
-        raise NotImplementedError
+        return self._candidate_type
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrendPullbackRule(ClassificationRule):
     name: str = "trend_pullback"
+    _candidate_type = CandidateType.TREND_PULLBACK
 
     def evaluate(self, stock: StockSnapshot, regime: MarketRegime) -> RuleResult:
         passed = (
@@ -134,29 +224,28 @@ class TrendPullbackRule(ClassificationRule):
             and stock.drawdown_6m <= -0.05
             and stock.drawdown_6m >= -0.2
         )
-        message = "장기 추세 위에서 5~20% 눌림 구간." if passed else "추세 눌림 조건 불충족."
+        message = _MSG["trend_pullback_pass"] if passed else _MSG["trend_pullback_fail"]
         return RuleResult(self.name, passed, message)
 
-    def candidate_type(self) -> CandidateType:
-        return CandidateType.TREND_PULLBACK
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeanReversionRule(ClassificationRule):
     name: str = "mean_reversion"
+    _candidate_type = CandidateType.MEAN_REVERSION
 
     def evaluate(self, stock: StockSnapshot, regime: MarketRegime) -> RuleResult:
         passed = stock.drawdown_6m <= -0.3 and stock.price < stock.ma_200
-        message = "과도한 하락 구간에서 평균회귀 후보." if passed else "과도한 하락 조건 불충족."
+        message = _MSG["mean_reversion_pass"] if passed else _MSG["mean_reversion_fail"]
         return RuleResult(self.name, passed, message)
 
-    def candidate_type(self) -> CandidateType:
-        return CandidateType.MEAN_REVERSION
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DefensiveIncomeRule(ClassificationRule):
     name: str = "defensive_income"
+    # Adds the [DEF] sub-condition lines to the message; they are also added
+    # whenever this module's logger is enabled for DEBUG.
+    debug: bool = False
+    _candidate_type = CandidateType.DEFENSIVE_INCOME
 
     def evaluate(self, stock: StockSnapshot, regime: MarketRegime) -> RuleResult:
         drawdown_ok = stock.drawdown_6m >= -0.15
@@ -180,6 +269,9 @@ class DefensiveIncomeRule(ClassificationRule):
             and price_not_extended
             and short_term_stable
         )
+        message = _MSG["defensive_income_pass"] if passed else _MSG["defensive_income_fail"]
+        if not (self.debug or _LOG.isEnabledFor(logging.DEBUG)):
+            return RuleResult(self.name, passed, message)
         price_band_ok = price_above_ma_200 and price_not_extended
         debug_lines = [
             f"[DEF] drawdown_6m={stock.drawdown_6m:.2f} >= -0.15 ({'PASS' if drawdown_ok else 'FAIL'})",
@@ -196,18 +288,11 @@ class DefensiveIncomeRule(ClassificationRule):
                 f"({'PASS' if short_term_stable else 'FAIL'})"
             ),
         ]
-        message = (
-            "완만한 6개월 낙폭, 낮은 변동성, 200MA 근처 안정, 단기 과열 없음."
-            if passed
-            else "방어형 가격/변동성 안정 조건 불충족."
-        )
         return RuleResult(self.name, passed, "\n".join(debug_lines + [message]))
 
-    def candidate_type(self) -> CandidateType:
-        return CandidateType.DEFENSIVE_INCOME
-
 
 class EntryRule:
+    __slots__ = ()
     name = "entry"
 
     def evaluate(self, stock: StockSnapshot) -> RuleResult:
@@ -217,39 +302,39 @@ class EntryRule:
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrendPullbackEntryRule(EntryRule):
     name: str = "trend_pullback_entry"
 
     def evaluate(self, stock: StockSnapshot) -> RuleResult:
         passed = stock.price > stock.ma_50 and stock.volume >= stock.avg_volume * 1.2
-        message = "50일선 회복과 거래량 증가 확인." if passed else "지지/거래량 확인 필요."
+        message = _MSG["trend_pullback_entry_pass"] if passed else _MSG["trend_pullback_entry_fail"]
         return RuleResult(self.name, passed, message)
 
     def entry_decision(self, passed: bool) -> EntryDecision:
         return EntryDecision.ENTRY_ALLOWED if passed else EntryDecision.WAIT_FOR_CONFIRMATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeanReversionEntryRule(EntryRule):
     name: str = "mean_reversion_entry"
 
     def evaluate(self, stock: StockSnapshot) -> RuleResult:
         passed = stock.price > stock.ma_50 and stock.volume >= stock.avg_volume * 1.3
-        message = "단기 반등 신호와 거래량 급증 확인." if passed else "반등 구조 확인 필요."
+        message = _MSG["mean_reversion_entry_pass"] if passed else _MSG["mean_reversion_entry_fail"]
         return RuleResult(self.name, passed, message)
 
     def entry_decision(self, passed: bool) -> EntryDecision:
         return EntryDecision.ENTRY_ALLOWED if passed else EntryDecision.WAIT_FOR_CONFIRMATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DefensiveIncomeEntryRule(EntryRule):
     name: str = "defensive_income_entry"
 
     def evaluate(self, stock: StockSnapshot) -> RuleResult:
         passed = stock.price > stock.ma_200
-        message = "장기 이동평균 위에서 방어형 유지." if passed else "장기 추세 회복 확인 필요."
+        message = _MSG["defensive_income_entry_pass"] if passed else _MSG["defensive_income_entry_fail"]
         return RuleResult(self.name, passed, message)
 
     def entry_decision(self, passed: bool) -> EntryDecision:
@@ -259,6 +344,7 @@ class DefensiveIncomeEntryRule(EntryRule):
 class Classifier:
     def __init__(self, rules: List[ClassificationRule]):
         self.rules = rules
+        self._typed_rules = [(rule, rule.candidate_type()) for rule in rules]
 
     def _apply_priority(
         self,
@@ -273,7 +359,7 @@ class Classifier:
             and stock.volatility_annual <= 0.20
         )
         if defensive_priority:
-            messages.append("복수 후보 중 DEFENSIVE_INCOME 우선 규칙 적용.")
+            messages.append(_MSG["defensive_priority"])
             return CandidateType.DEFENSIVE_INCOME
 
         priority_order = [
@@ -290,27 +376,37 @@ class Classifier:
     def classify(self, stock: StockSnapshot, regime: MarketRegime) -> ClassificationResult:
         hits: List[CandidateType] = []
         messages: List[str] = []
-        for rule in self.rules:
+        for rule, candidate_type in self._typed_rules:
             result = rule.evaluate(stock, regime)
             message_lines = result.message.splitlines()
             messages.extend(message_lines if message_lines else [result.message])
             if result.passed:
-                hits.append(rule.candidate_type())
+                hits.append(candidate_type)
         if len(hits) == 1:
             return ClassificationResult(hits[0], messages)
         if len(hits) > 1:
             selected = self._apply_priority(hits, stock, messages)
             return ClassificationResult(selected, messages)
-        messages.append("후보 유형을 결정할 수 없음.")
+        messages.append(_MSG["no_candidate"])
         return ClassificationResult(None, messages)
 
 
 class EntryEvaluator:
     def __init__(self, rules: dict[CandidateType, EntryRule]):
         self.rules = rules
+        # Indexed by CandidateType definition order, i.e. engine_numba's candidate codes.
+        self._rules_by_code = tuple(rules.get(candidate_type) for candidate_type in CandidateType)
 
     def evaluate(self, candidate_type: CandidateType, stock: StockSnapshot) -> EntryResult:
-        rule = self.rules[candidate_type]
+        return self._evaluate_rule(self.rules[candidate_type], stock)
+
+    def evaluate_code(self, candidate_code: int, stock: StockSnapshot) -> EntryResult:
+        rule = self._rules_by_code[candidate_code]
+        if rule is None:
+            raise KeyError(candidate_code)
+        return self._evaluate_rule(rule, stock)
+
+    def _evaluate_rule(self, rule: EntryRule, stock: StockSnapshot) -> EntryResult:
         result = rule.evaluate(stock)
         decision = rule.entry_decision(result.passed)
         return EntryResult(decision, [result.message])
@@ -323,7 +419,7 @@ class PositionSizer:
         max_position_pct = min(constraints.max_position_pct, scaled_position)
         tranche_pct = max_position_pct / constraints.tranche_count
         messages = [
-            "변동성에 따라 최대 비중을 축소 적용.",
+            _MSG["position_scaled"],
             f"단일 종목 최대 비중 {max_position_pct:.2%}, 트랜치 {constraints.tranche_count}회 분할.",
         ]
         return PositionPlan(max_position_pct, tranche_pct, constraints.max_risk_pct, messages)
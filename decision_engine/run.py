@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import math
-from dataclasses import asdict
+import threading
+import time
+from dataclasses import replace
+from typing import Iterable
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the stdlib encoder produces the same text.
+    orjson = None
 
 from decision_engine.data_sources import yfinance_source
+from decision_engine.demo import build_engine, print_report
 from decision_engine.engine import DecisionEngine
-from decision_engine.indicators import build_indicators
+from decision_engine.indicators import build_indicators_cached
 from decision_engine.models import (
     DecisionReport,
     FinalDecision,
@@ -16,133 +27,177 @@ from decision_engine.models import (
     PortfolioConstraints,
     StockSnapshot,
 )
-from decision_engine.rules import (
-    BusinessClarityGate,
-    Classifier,
-    DefensiveIncomeEntryRule,
-    DefensiveIncomeRule,
-    EntryEvaluator,
-    EventRiskGate,
-    LiquidityGate,
-    MeanReversionEntryRule,
-    MeanReversionRule,
-    PositionSizer,
-    RegimeMismatchGate,
-    RegimeRule,
-    TrendPullbackEntryRule,
-    TrendPullbackRule,
-    VolatilityGate,
-)
 
+_LIVE_SNAPSHOT_TTL = 300.0
+_live_snapshot_cache: dict[tuple[str, bool], tuple[float, StockSnapshot]] = {}
+_live_snapshot_cache_lock = threading.Lock()
+
+
+_MARKET_SNAPSHOTS = {
+    MarketRegime.RISK_ON: MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True),
+    MarketRegime.RISK_OFF: MarketSnapshot(index_price=3800, index_ma_200=4000, vix=28, rate_trend_up=False),
+    MarketRegime.NEUTRAL: MarketSnapshot(index_price=4050, index_ma_200=4000, vix=22, rate_trend_up=True),
+}
+_DEFAULT_MARKET_SNAPSHOT = _MARKET_SNAPSHOTS[MarketRegime.RISK_ON]
 
-def build_engine() -> DecisionEngine:
-    regime_rule = RegimeRule()
-    gates = [
-        LiquidityGate(),
-        VolatilityGate(),
-        RegimeMismatchGate(),
-        EventRiskGate(),
-        BusinessClarityGate(),
-    ]
-    classifier = Classifier([TrendPullbackRule(), MeanReversionRule(), DefensiveIncomeRule()])
-    entry_evaluator = EntryEvaluator(
-        {
-            TrendPullbackRule().candidate_type(): TrendPullbackEntryRule(),
-            MeanReversionRule().candidate_type(): MeanReversionEntryRule(),
-            DefensiveIncomeRule().candidate_type(): DefensiveIncomeEntryRule(),
-        }
-    )
-    position_sizer = PositionSizer()
-    return DecisionEngine(regime_rule, gates, classifier, entry_evaluator, position_sizer)
+
+@functools.lru_cache(maxsize=1)
+def get_default_engine() -> DecisionEngine:
+    """
+    Return the process-wide default engine.
+
+    Rules and gates hold only their thresholds and the engine keeps no
+    per-evaluation state, so one instance is safe to reuse across calls and
+    threads.
+    """
+    return build_engine()
 
 
 def build_market_snapshot(regime: MarketRegime | None) -> MarketSnapshot:
-    if regime == MarketRegime.RISK_ON:
-        return MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
-    if regime == MarketRegime.RISK_OFF:
-        return MarketSnapshot(index_price=3800, index_ma_200=4000, vix=28, rate_trend_up=False)
-    if regime == MarketRegime.NEUTRAL:
-        return MarketSnapshot(index_price=4050, index_ma_200=4000, vix=22, rate_trend_up=True)
-    return MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
+    return _MARKET_SNAPSHOTS.get(regime, _DEFAULT_MARKET_SNAPSHOT)
+
+
+_SAMPLE_STOCKS = {
+    "PG": StockSnapshot(
+        ticker="PG",
+        price=150,
+        avg_volume=4200000,
+        volume=4800000,
+        volatility_annual=0.18,
+        ma_50=148,
+        ma_200=140,
+        drawdown_6m=-0.08,
+        dividend_yield=0.035,
+        earnings_risk=False,
+        regulatory_risk=False,
+        business_clarity=True,
+        sector_defensive=True,
+    ),
+    "TSLA": StockSnapshot(
+        ticker="TSLA",
+        price=220,
+        avg_volume=8000000,
+        volume=9000000,
+        volatility_annual=0.6,
+        ma_50=240,
+        ma_200=260,
+        drawdown_6m=-0.4,
+        dividend_yield=0.0,
+        earnings_risk=True,
+        regulatory_risk=False,
+        business_clarity=True,
+        sector_defensive=False,
+    ),
+    "MSFT": StockSnapshot(
+        ticker="MSFT",
+        price=410,
+        avg_volume=3000000,
+        volume=3200000,
+        volatility_annual=0.22,
+        ma_50=405,
+        ma_200=390,
+        drawdown_6m=-0.12,
+        dividend_yield=0.008,
+        earnings_risk=False,
+        regulatory_risk=False,
+        business_clarity=True,
+        sector_defensive=False,
+    ),
+}
+
+_DEFAULT_SAMPLE_STOCK = StockSnapshot(
+    ticker="",
+    price=52,
+    avg_volume=500000,
+    volume=600000,
+    volatility_annual=0.28,
+    ma_50=50,
+    ma_200=45,
+    drawdown_6m=-0.12,
+    dividend_yield=0.01,
+    earnings_risk=False,
+    regulatory_risk=False,
+    business_clarity=True,
+    sector_defensive=False,
+)
 
 
 def sample_stock_for_ticker(ticker: str) -> StockSnapshot:
     normalized = ticker.upper()
-    samples = {
-        "PG": StockSnapshot(
-            ticker=normalized,
-            price=150,
-            avg_volume=4200000,
-            volume=4800000,
-            volatility_annual=0.18,
-            ma_50=148,
-            ma_200=140,
-            drawdown_6m=-0.08,
-            dividend_yield=0.035,
-            earnings_risk=False,
-            regulatory_risk=False,
-            business_clarity=True,
-            sector_defensive=True,
-        ),
-        "TSLA": StockSnapshot(
-            ticker=normalized,
-            price=220,
-            avg_volume=8000000,
-            volume=9000000,
-            volatility_annual=0.6,
-            ma_50=240,
-            ma_200=260,
-            drawdown_6m=-0.4,
-            dividend_yield=0.0,
-            earnings_risk=True,
-            regulatory_risk=False,
-            business_clarity=True,
-            sector_defensive=False,
-        ),
-        "MSFT": StockSnapshot(
-            ticker=normalized,
-            price=410,
-            avg_volume=3000000,
-            volume=3200000,
-            volatility_annual=0.22,
-            ma_50=405,
-            ma_200=390,
-            drawdown_6m=-0.12,
-            dividend_yield=0.008,
-            earnings_risk=False,
-            regulatory_risk=False,
-            business_clarity=True,
-            sector_defensive=False,
-        ),
-    }
-    return samples.get(
-        normalized,
-        StockSnapshot(
-            ticker=normalized,
-            price=52,
-            avg_volume=500000,
-            volume=600000,
-            volatility_annual=0.28,
-            ma_50=50,
-            ma_200=45,
-            drawdown_6m=-0.12,
-            dividend_yield=0.01,
-            earnings_risk=False,
-            regulatory_risk=False,
-            business_clarity=True,
-            sector_defensive=False,
-        ),
-    )
+    # Snapshots are frozen, so the module-level samples can be shared.
+    sample = _SAMPLE_STOCKS.get(normalized)
+    if sample is not None:
+        return sample
+    return replace(_DEFAULT_SAMPLE_STOCK, ticker=normalized)
 
 
 def build_live_stock_snapshot(
     ticker: str,
     use_adjusted_close: bool = False,
+    cache_dir: str | None = None,
+) -> tuple[StockSnapshot | None, str | None]:
+    """
+    Build a StockSnapshot from live data, reusing results for five minutes.
+
+    Only successful snapshots are cached; a failed fetch is retried on the
+    next call. The first build reads fetch_ohlcv_cached's per-day memo (which
+    a batch prefetch may have filled); once a snapshot expires it is rebuilt
+    from a fresh download, so long-running callers see intraday updates.
+    Batch callers refresh expired tickers up front with
+    pop_expired_live_snapshots instead.
+    cache_dir is passed to fetch_ohlcv_cached so raw OHLCV is also kept on
+    disk across runs.
+    """
+    key = (ticker.upper(), use_adjusted_close)
+    now = time.monotonic()
+    with _live_snapshot_cache_lock:
+        entry = _live_snapshot_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1], None
+
+    stock, reason = _build_live_stock_snapshot(ticker, use_adjusted_close, cache_dir, refresh=entry is not None)
+    if stock is not None:
+        with _live_snapshot_cache_lock:
+            _live_snapshot_cache[key] = (now + _LIVE_SNAPSHOT_TTL, stock)
+    return stock, reason
+
+
+def pop_expired_live_snapshots(tickers: Iterable[str], use_adjusted_close: bool = False) -> list[str]:
+    """
+    Drop expired live snapshots for tickers and return those tickers.
+
+    A batch prefetch passes the result to fetch_ohlcv_many(refresh=...), so
+    the expired tickers are redownloaded in one request; with their entries
+    gone, build_live_stock_snapshot then reads that fresh memo instead of
+    refreshing each ticker on its own.
+    """
+    now = time.monotonic()
+    expired = []
+    with _live_snapshot_cache_lock:
+        for ticker in tickers:
+            key = (ticker.upper(), use_adjusted_close)
+            entry = _live_snapshot_cache.get(key)
+            if entry is not None and now >= entry[0]:
+                del _live_snapshot_cache[key]
+                expired.append(key[0])
+    return expired
+
+
+def clear_live_snapshot_cache() -> None:
+    with _live_snapshot_cache_lock:
+        _live_snapshot_cache.clear()
+
+
+def _build_live_stock_snapshot(
+    ticker: str,
+    use_adjusted_close: bool,
+    cache_dir: str | None,
+    refresh: bool = False,
 ) -> tuple[StockSnapshot | None, str | None]:
-    data = yfinance_source.fetch_ohlcv(ticker)
+    data = yfinance_source.fetch_ohlcv_cached(ticker, cache_dir=cache_dir, refresh=refresh)
     if data is None:
         return None, "라이브 데이터 수집 실패 또는 데이터가 없어 WAIT 처리."
-    indicators = build_indicators(data, use_adjusted_close=use_adjusted_close)
+    indicators = build_indicators_cached(data, use_adjusted_close=use_adjusted_close)
     if indicators is None:
         return None, "라이브 데이터 지표 산출에 필요한 데이터가 부족하여 WAIT 처리."
 
@@ -165,24 +220,16 @@ def build_live_stock_snapshot(
     return stock, None
 
 
-def print_report(title: str, report) -> None:
-    print("=" * 60)
-    print(title)
-    print("(1) Decision")
-    print(report.decision.value)
-    print("(2) Reason Log")
-    for item in report.reason_log:
-        print(f"- {item}")
-    print("(3) Action Plan")
-    for item in report.action_plan:
-        print(f"- {item}")
-
-
 def report_to_json(report, ticker: str, market_regime: MarketRegime | None) -> str:
-    payload = asdict(report)
-    payload["decision"] = report.decision.value
-    payload["ticker"] = ticker
-    payload["market_regime_override"] = market_regime.value if market_regime else None
+    payload = {
+        "decision": report.decision.value,
+        "reason_log": report.reason_log,
+        "action_plan": report.action_plan,
+        "ticker": ticker,
+        "market_regime_override": market_regime.value if market_regime else None,
+    }
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(payload, ensure_ascii=False, indent=2)
 
 
@@ -205,6 +252,10 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Use adjusted close price when available",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for caching downloaded OHLCV across runs (live mode)",
+    )
     parser.add_argument("--json", action="store_true", help="Also output JSON result")
     return parser.parse_args(argv)
 
@@ -212,12 +263,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
     regime_override = MarketRegime(args.market_regime) if args.market_regime else None
-    engine = build_engine()
+    engine = get_default_engine()
     market = build_market_snapshot(regime_override)
     constraints = PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02)
     ticker = args.ticker.upper()
     if args.mode == "live":
-        stock, reason = build_live_stock_snapshot(ticker, use_adjusted_close=args.use_adjusted_close)
+        stock, reason = build_live_stock_snapshot(
+            ticker, use_adjusted_close=args.use_adjusted_close, cache_dir=args.cache_dir
+        )
         if stock is None:
             report = DecisionReport(
                 FinalDecision.WAIT,
@@ -2,29 +2,53 @@ from __future__ import annotations
 
 import argparse
 import csv
-import datetime as dt
+import io
+import json
 import os
+import re
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the stdlib encoder produces the same JSON.
+    orjson = None
+
+try:
+    from tqdm.auto import tqdm
+except ImportError:
+    # Optional progress bar; scans run the same without it.
+    tqdm = None
+
+from decision_engine.data_sources import yfinance_source
+from decision_engine.data_sources.yfinance_source import is_valid_ticker
 from decision_engine.engine import DecisionEngine
 from decision_engine.models import (
     DecisionReport,
     FinalDecision,
-    MarketRegime,
+    MarketSnapshot,
     PortfolioConstraints,
     StockSnapshot,
 )
 from decision_engine.run import (
-    build_engine,
     build_live_stock_snapshot,
     build_market_snapshot,
+    get_default_engine,
+    pop_expired_live_snapshots,
     sample_stock_for_ticker,
 )
 
 
-@dataclass(frozen=True)
+_APPROVE = FinalDecision.APPROVE.value
+_WAIT = FinalDecision.WAIT.value
+_DECISION_ORDER = (_APPROVE, _WAIT, FinalDecision.REJECT.value)
+
+
+@dataclass(frozen=True, slots=True)
 class ScanResult:
     ticker: str
     decision: str
@@ -53,29 +77,49 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Use adjusted close price when available",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for caching downloaded OHLCV across runs (live mode)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "md", "both"],
+        default="both",
+        help="Which result files to write",
+    )
+    parser.add_argument("--json", action="store_true", help="Also write results as JSON")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Number of tickers evaluated concurrently (live mode is I/O bound)",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
 def load_tickers(value: str) -> list[str]:
-    if os.path.isfile(value):
+    try:
         with open(value, encoding="utf-8") as handle:
-            tickers = [line.strip() for line in handle if line.strip()]
-    else:
+            # One bulk read split in C beats iterating a 10k-line file.
+            lines = handle.read().splitlines()
+        tickers = [line.strip() for line in lines if line.strip()]
+    except OSError:
+        # Not a readable file: treat the value as a comma-separated list.
         tickers = [item.strip() for item in value.split(",") if item.strip()]
-    normalized = []
-    seen = set()
-    for ticker in tickers:
-        upper = ticker.upper()
-        if upper not in seen:
-            seen.add(upper)
-            normalized.append(upper)
-    return normalized
+    return list(dict.fromkeys(ticker.upper() for ticker in tickers))
+
+
+_CANDIDATE_PREFIX = "후보 유형:"
+_CANDIDATE_PREFIX_LEN = len(_CANDIDATE_PREFIX)
 
 
 def extract_candidate_type(action_plan: Iterable[str]) -> str | None:
     for item in action_plan:
-        if item.startswith("후보 유형:"):
-            return item.replace("후보 유형:", "").strip().rstrip(".")
+        if item.startswith(_CANDIDATE_PREFIX):
+            return item[_CANDIDATE_PREFIX_LEN:].strip().rstrip(".")
     return None
 
 
@@ -88,65 +132,62 @@ EXCLUDED_REASON_PHRASES = (
 )
 
 
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_EXCLUDED_REASON_RE = _keyword_pattern(EXCLUDED_REASON_PHRASES)
+_WAIT_KEYWORD_RE = _keyword_pattern(("보류", "불충족", "필요", "결정할 수 없음", "실패", "데이터", "없음"))
+
+
+def _filter_reasons(reason_log: Iterable[str]) -> list[str]:
+    return [reason for reason in reason_log if not _EXCLUDED_REASON_RE.search(reason)]
+
+
 def summarize_wait_reason(reason_log: Iterable[str]) -> str:
-    keywords = (
-        "보류",
-        "불충족",
-        "필요",
-        "결정할 수 없음",
-        "실패",
-        "데이터",
-        "없음",
-    )
-    candidates = [
-        reason
-        for reason in reason_log
-        if any(keyword in reason for keyword in keywords)
-        and not any(phrase in reason for phrase in EXCLUDED_REASON_PHRASES)
-    ]
-    if candidates:
-        return candidates[-1]
+    return _summarize_filtered_wait_reason(_filter_reasons(reason_log))
+
+
+def _summarize_filtered_wait_reason(filtered_reasons: list[str]) -> str:
+    # The last matching reason wins, so scan from the end and stop at the first hit.
+    for reason in reversed(filtered_reasons):
+        if _WAIT_KEYWORD_RE.search(reason):
+            return reason
     return "(no blocking reason detected)"
 
 
+_BLOCK_STAGE_PATTERNS = (
+    ("DATA", _keyword_pattern(("데이터", "라이브 데이터", "수집 실패", "지표 산출", "오류"))),
+    ("CANDIDATE", _keyword_pattern(("후보 유형", "결정할 수 없음", "충돌"))),
+    (
+        "ENTRY_TRIGGER",
+        _keyword_pattern(
+            (
+                "지지/거래량 확인 필요",
+                "반등 구조 확인 필요",
+                "장기 추세 회복 확인 필요",
+                "진입 조건",
+                "거래량/이동평균 조건 재확인",
+                "1차 진입 조건 미충족",
+            )
+        ),
+    ),
+)
+
+
 def infer_block_stage(reason_log: Iterable[str], decision: str) -> str:
-    if decision == FinalDecision.APPROVE.value:
+    if decision == _APPROVE:
         return "NONE"
+    return _infer_filtered_block_stage(_filter_reasons(reason_log), decision)
 
-    filtered_reasons = [
-        reason for reason in reason_log if not any(phrase in reason for phrase in EXCLUDED_REASON_PHRASES)
-    ]
-
-    data_keywords = ("데이터", "라이브 데이터", "수집 실패", "지표 산출", "오류")
-    candidate_keywords = ("후보 유형", "결정할 수 없음", "충돌")
-    entry_keywords = (
-        "지지/거래량 확인 필요",
-        "반등 구조 확인 필요",
-        "장기 추세 회복 확인 필요",
-        "진입 조건",
-        "거래량/이동평균 조건 재확인",
-        "1차 진입 조건 미충족",
-    )
-    hard_gate_keywords = (
-        "유동성",
-        "변동성",
-        "레짐",
-        "이벤트",
-        "비즈니스",
-        "사업 구조",
-        "규제",
-        "실적",
-        "거절",
-    )
 
-    if any(keyword in reason for reason in filtered_reasons for keyword in data_keywords):
-        return "DATA"
-    if any(keyword in reason for reason in filtered_reasons for keyword in candidate_keywords):
-        return "CANDIDATE"
-    if any(keyword in reason for reason in filtered_reasons for keyword in entry_keywords):
-        return "ENTRY_TRIGGER"
-    if any(keyword in reason for reason in filtered_reasons for keyword in hard_gate_keywords):
-        return "HARD_GATE"
+def _infer_filtered_block_stage(filtered_reasons: list[str], decision: str) -> str:
+    if decision == _APPROVE:
+        return "NONE"
+    for stage, pattern in _BLOCK_STAGE_PATTERNS:
+        if any(pattern.search(reason) for reason in filtered_reasons):
+            return stage
+    # Hard-gate keywords (유동성, 변동성, 레짐, ...) and anything unmatched both land here.
     return "HARD_GATE"
 
 
@@ -171,35 +212,27 @@ def format_key_metrics(stock: StockSnapshot | None) -> str:
     return ", ".join(parts)
 
 
+# candidate_type -> (volume multiple, moving-average field, volatility cap)
+_TRIGGER_SPECS = {
+    "TREND_PULLBACK": (1.2, "ma_50", 0.45),
+    "MEAN_REVERSION": (1.3, "ma_50", 0.45),
+    "DEFENSIVE_INCOME": (1.0, "ma_200", 0.25),
+}
+
+
 def evaluate_entry_trigger_conditions(result: ScanResult) -> dict[str, bool] | None:
     if result.stock is None or not result.candidate_type:
         return None
-
-    stock = result.stock
-    candidate_type = result.candidate_type
-
-    if candidate_type == "TREND_PULLBACK":
-        volume_threshold = 1.2
-        volume_pass = stock.volume >= stock.avg_volume * volume_threshold
-        ma_pass = stock.price > stock.ma_50
-        volatility_pass = stock.volatility_annual <= 0.45
-    elif candidate_type == "MEAN_REVERSION":
-        volume_threshold = 1.3
-        volume_pass = stock.volume >= stock.avg_volume * volume_threshold
-        ma_pass = stock.price > stock.ma_50
-        volatility_pass = stock.volatility_annual <= 0.45
-    elif candidate_type == "DEFENSIVE_INCOME":
-        volume_threshold = 1.0
-        volume_pass = stock.volume >= stock.avg_volume * volume_threshold
-        ma_pass = stock.price > stock.ma_200
-        volatility_pass = stock.volatility_annual <= 0.25
-    else:
+    spec = _TRIGGER_SPECS.get(result.candidate_type)
+    if spec is None:
         return None
 
+    stock = result.stock
+    volume_threshold, ma_field, volatility_cap = spec
     return {
-        "거래량 조건": volume_pass,
-        "이동평균 조건": ma_pass,
-        "변동성 조건": volatility_pass,
+        "거래량 조건": stock.volume >= stock.avg_volume * volume_threshold,
+        "이동평균 조건": stock.price > getattr(stock, ma_field),
+        "변동성 조건": stock.volatility_annual <= volatility_cap,
     }
 
 
@@ -238,11 +271,11 @@ def analyze_entry_trigger_waits(
 
     top_fails = fail_counts.most_common(3)
     notes = [
-        "TREND_PULLBACK: 거래량>=1.2배, 가격>MA50, 변동성<=0.45.",
-        "MEAN_REVERSION: 거래량>=1.3배, 가격>MA50, 변동성<=0.45.",
-        "DEFENSIVE_INCOME: 거래량>=1.0배, 가격>MA200, 변동성<=0.25.",
-        "시뮬레이션은 해당 트리거 1개만 FAIL인 경우에 한해 APPROVE 전환 가능 수로 집계.",
+        f"{candidate_type}: 거래량>={volume_threshold:.1f}배, 가격>{ma_field.replace('_', '').upper()}, "
+        f"변동성<={volatility_cap:.2f}."
+        for candidate_type, (volume_threshold, ma_field, volatility_cap) in _TRIGGER_SPECS.items()
     ]
+    notes.append("시뮬레이션은 해당 트리거 1개만 FAIL인 경우에 한해 APPROVE 전환 가능 수로 집계.")
     return trigger_counts, top_fails, simulations, notes
 
 
@@ -251,12 +284,14 @@ def evaluate_ticker(
     ticker: str,
     mode: str,
     constraints: PortfolioConstraints,
-    market_regime: MarketRegime | None,
+    market: MarketSnapshot,
     use_adjusted_close: bool,
+    cache_dir: str | None = None,
 ) -> ScanResult:
-    market = build_market_snapshot(market_regime)
     if mode == "live":
-        stock, reason = build_live_stock_snapshot(ticker, use_adjusted_close=use_adjusted_close)
+        stock, reason = build_live_stock_snapshot(
+            ticker, use_adjusted_close=use_adjusted_close, cache_dir=cache_dir
+        )
         if stock is None:
             report = DecisionReport(
                 FinalDecision.WAIT,
@@ -270,10 +305,12 @@ def evaluate_ticker(
         report = engine.evaluate(market, stock, constraints)
 
     candidate_type = extract_candidate_type(report.action_plan)
+    # Both summaries ignore the same excluded phrases; filter the log once.
+    filtered_reasons = _filter_reasons(report.reason_log)
     wait_reason_top = None
     if report.decision == FinalDecision.WAIT:
-        wait_reason_top = summarize_wait_reason(report.reason_log)
-    block_stage = infer_block_stage(report.reason_log, report.decision.value)
+        wait_reason_top = _summarize_filtered_wait_reason(filtered_reasons)
+    block_stage = _infer_filtered_block_stage(filtered_reasons, report.decision.value)
     key_metrics = format_key_metrics(stock)
 
     return ScanResult(
@@ -287,108 +324,163 @@ def evaluate_ticker(
     )
 
 
-def write_csv(path: str, results: list[ScanResult]) -> None:
-    with open(path, "w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(
-            handle,
-            fieldnames=[
-                "ticker",
-                "decision",
-                "candidate_type",
-                "wait_reason_top",
-                "block_stage",
-                "key_metrics",
-            ],
+def _scan_ticker(
+    engine: DecisionEngine,
+    ticker: str,
+    mode: str,
+    constraints: PortfolioConstraints,
+    market: MarketSnapshot,
+    use_adjusted_close: bool,
+    cache_dir: str | None = None,
+) -> ScanResult:
+    if mode == "live" and not is_valid_ticker(ticker):
+        return _data_wait_result(ticker, "종목 코드 형식이 올바르지 않아 WAIT 처리.")
+    try:
+        return evaluate_ticker(engine, ticker, mode, constraints, market, use_adjusted_close, cache_dir)
+    except Exception as exc:  # noqa: BLE001 - continue scanning
+        return _data_wait_result(ticker, f"스캔 오류로 WAIT 처리: {exc}")
+
+
+def _data_wait_result(ticker: str, reason: str) -> ScanResult:
+    return ScanResult(
+        ticker=ticker,
+        decision=_WAIT,
+        candidate_type=None,
+        wait_reason_top=reason,
+        block_stage="DATA",
+        key_metrics="",
+        stock=None,
+    )
+
+
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+class StreamingCsvWriter:
+    """Write ScanResult rows to a CSV file as they arrive; use as a context manager."""
+
+    fieldnames = (
+        "ticker",
+        "decision",
+        "candidate_type",
+        "wait_reason_top",
+        "block_stage",
+        "key_metrics",
+    )
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._handle = None
+        self._writer = None
+
+    def __enter__(self) -> StreamingCsvWriter:
+        # A 1 MiB buffer keeps large scans to a handful of write syscalls.
+        self._handle = open(self.path, "w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE)
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(self.fieldnames)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._handle.close()
+
+    def writerow(self, result: ScanResult) -> None:
+        self._writer.writerow(
+            (
+                result.ticker,
+                result.decision,
+                result.candidate_type or "",
+                result.wait_reason_top or "",
+                result.block_stage,
+                result.key_metrics,
+            )
         )
-        writer.writeheader()
+
+
+def write_csv(path: str, results: list[ScanResult]) -> None:
+    with StreamingCsvWriter(path) as writer:
         for result in results:
-            writer.writerow(
-                {
-                    "ticker": result.ticker,
-                    "decision": result.decision,
-                    "candidate_type": result.candidate_type or "",
-                    "wait_reason_top": result.wait_reason_top or "",
-                    "block_stage": result.block_stage,
-                    "key_metrics": result.key_metrics,
-                }
-            )
+            writer.writerow(result)
 
 
 def format_markdown(results: list[ScanResult]) -> str:
-    decisions = Counter(result.decision for result in results)
-    candidates = Counter(result.candidate_type for result in results if result.candidate_type)
-    wait_reasons = Counter(
-        result.wait_reason_top for result in results if result.decision == FinalDecision.WAIT.value
-    )
-    block_stages = Counter(result.block_stage for result in results)
-    entry_trigger_waits = [
-        result
-        for result in results
-        if result.decision == FinalDecision.WAIT.value and result.block_stage == "ENTRY_TRIGGER"
-    ]
-
-    lines = ["# 스캔 결과", "", "## 요약 테이블", ""]
-    lines.append("| Ticker | Decision | Candidate Type | WAIT Reason | Block Stage | Key Metrics |")
-    lines.append("| --- | --- | --- | --- | --- | --- |")
+    decisions: Counter = Counter()
+    candidates: Counter = Counter()
+    wait_reasons: Counter = Counter()
+    block_stages: Counter = Counter()
+    entry_trigger_waits: list[ScanResult] = []
     for result in results:
-        lines.append(
-            "| "
-            f"{result.ticker} | {result.decision} | {result.candidate_type or ''} | "
-            f"{result.wait_reason_top or ''} | {result.block_stage} | {result.key_metrics} |"
-        )
+        decisions[result.decision] += 1
+        block_stages[result.block_stage] += 1
+        if result.candidate_type:
+            candidates[result.candidate_type] += 1
+        if result.decision == _WAIT:
+            wait_reasons[result.wait_reason_top] += 1
+            if result.block_stage == "ENTRY_TRIGGER":
+                entry_trigger_waits.append(result)
+
+    buffer = io.StringIO()
+    write = buffer.write
+    write("# 스캔 결과\n\n## 요약 테이블\n\n")
+    write("| Ticker | Decision | Candidate Type | WAIT Reason | Block Stage | Key Metrics |\n")
+    write("| --- | --- | --- | --- | --- | --- |\n")
+    buffer.writelines(
+        f"| {result.ticker} | {result.decision} | {result.candidate_type or ''} | "
+        f"{result.wait_reason_top or ''} | {result.block_stage} | {result.key_metrics} |\n"
+        for result in results
+    )
 
-    lines.extend(["", "## 통계", ""])
-    lines.append("### Decision 분포")
-    for decision in [FinalDecision.APPROVE.value, FinalDecision.WAIT.value, FinalDecision.REJECT.value]:
-        lines.append(f"- {decision}: {decisions.get(decision, 0)}")
+    write("\n## 통계\n\n### Decision 분포\n")
+    for decision in _DECISION_ORDER:
+        write(f"- {decision}: {decisions.get(decision, 0)}\n")
 
-    lines.extend(["", "### Candidate Type 분포"])
+    write("\n### Candidate Type 분포\n")
     if candidates:
         for candidate, count in candidates.most_common():
-            lines.append(f"- {candidate}: {count}")
+            write(f"- {candidate}: {count}\n")
     else:
-        lines.append("- 후보 유형 없음")
+        write("- 후보 유형 없음\n")
 
-    lines.extend(["", "### WAIT 사유 Top 5"])
+    write("\n### WAIT 사유 Top 5\n")
     if wait_reasons:
         for reason, count in wait_reasons.most_common(5):
-            lines.append(f"- {reason}: {count}")
+            write(f"- {reason}: {count}\n")
     else:
-        lines.append("- WAIT 사유 없음")
+        write("- WAIT 사유 없음\n")
 
-    lines.extend(["", "### Block Stage 분포"])
+    write("\n### Block Stage 분포\n")
     if block_stages:
         for stage, count in block_stages.most_common():
-            lines.append(f"- {stage}: {count}")
+            write(f"- {stage}: {count}\n")
     else:
-        lines.append("- Block Stage 없음")
+        write("- Block Stage 없음\n")
 
-    if decisions.get(FinalDecision.APPROVE.value, 0) == 0:
-        lines.extend(["", "⚠️ APPROVE가 0개입니다. 진입 트리거가 과도할 가능성이 있습니다."])
+    if decisions.get(_APPROVE, 0) == 0:
+        write("\n⚠️ APPROVE가 0개입니다. 진입 트리거가 과도할 가능성이 있습니다.\n")
 
-    lines.extend(["", "### ENTRY_TRIGGER WAIT 분석"])
+    write("\n### ENTRY_TRIGGER WAIT 분석\n")
     if entry_trigger_waits:
         trigger_counts, trigger_fails, trigger_simulations, trigger_notes = analyze_entry_trigger_waits(
             entry_trigger_waits
         )
-        lines.extend(["", "#### 트리거 조건별 PASS/FAIL"])
+        write("\n#### 트리거 조건별 PASS/FAIL\n")
         for trigger_name, counts in trigger_counts.items():
-            lines.append(f"- {trigger_name}: PASS {counts['PASS']} / FAIL {counts['FAIL']}")
+            write(f"- {trigger_name}: PASS {counts['PASS']} / FAIL {counts['FAIL']}\n")
 
-        lines.extend(["", "#### FAIL 빈도 Top 3"])
+        write("\n#### FAIL 빈도 Top 3\n")
         for trigger, count in trigger_fails:
-            lines.append(f"- {trigger}: {count}")
+            write(f"- {trigger}: {count}\n")
 
-        lines.extend(["", "#### 트리거 완화 시 APPROVE 전환 시뮬레이션"])
+        write("\n#### 트리거 완화 시 APPROVE 전환 시뮬레이션\n")
         for trigger_name, count in trigger_simulations.items():
-            lines.append(f"- {trigger_name} 완화 시 전환 예상: {count}")
+            write(f"- {trigger_name} 완화 시 전환 예상: {count}\n")
 
-        lines.extend(["", "#### 트리거 판정 기준"])
-        lines.extend([f"- {note}" for note in trigger_notes])
+        write("\n#### 트리거 판정 기준\n")
+        for note in trigger_notes:
+            write(f"- {note}\n")
     else:
-        lines.append("- ENTRY_TRIGGER에서 WAIT된 종목이 없습니다.")
+        write("- ENTRY_TRIGGER에서 WAIT된 종목이 없습니다.\n")
 
-    return "\n".join(lines) + "\n"
+    return buffer.getvalue()
 
 
 def write_markdown(path: str, results: list[ScanResult]) -> None:
@@ -397,49 +489,88 @@ def write_markdown(path: str, results: list[ScanResult]) -> None:
         handle.write(content)
 
 
+def write_json(path: str, results: list[ScanResult]) -> None:
+    rows = [
+        {
+            "ticker": result.ticker,
+            "decision": result.decision,
+            "candidate_type": result.candidate_type,
+            "wait_reason_top": result.wait_reason_top,
+            "block_stage": result.block_stage,
+            "key_metrics": result.key_metrics,
+        }
+        for result in results
+    ]
+    if orjson is not None:
+        with open(path, "wb") as handle:
+            handle.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(rows, handle, ensure_ascii=False, indent=2)
+
+
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
     tickers = load_tickers(args.tickers)
     if not tickers:
         raise SystemExit("Ticker 목록이 비어 있습니다.")
 
-    engine = build_engine()
+    engine = get_default_engine()
     constraints = PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02)
-    market_regime = None
-
-    results: list[ScanResult] = []
-    for ticker in tickers:
-        try:
-            result = evaluate_ticker(
-                engine,
-                ticker,
-                args.mode,
-                constraints,
-                market_regime,
-                args.use_adjusted_close,
-            )
-        except Exception as exc:  # noqa: BLE001 - continue scanning
-            result = ScanResult(
-                ticker=ticker,
-                decision=FinalDecision.WAIT.value,
-                candidate_type=None,
-                wait_reason_top=f"스캔 오류로 WAIT 처리: {exc}",
-                block_stage="DATA",
-                key_metrics="",
-                stock=None,
-            )
-        results.append(result)
+    # The regime is fixed for the whole scan, so one snapshot serves every ticker.
+    market = build_market_snapshot(None)
+
+    if args.mode == "live":
+        # One batched download per 20 tickers seeds the OHLCV memo that
+        # build_live_stock_snapshot reads; tickers missing from the batch are
+        # retried individually by their worker. Snapshots that expired since
+        # an earlier scan in this process are refreshed in the same batch.
+        # Malformed symbols are answered by _scan_ticker without any request.
+        valid_tickers = [ticker for ticker in tickers if is_valid_ticker(ticker)]
+        expired = pop_expired_live_snapshots(valid_tickers, args.use_adjusted_close)
+        yfinance_source.fetch_ohlcv_many(valid_tickers, cache_dir=args.cache_dir, refresh=expired)
+
+    def scan_one(ticker: str) -> ScanResult:
+        return _scan_ticker(
+            engine, ticker, args.mode, constraints, market, args.use_adjusted_close, args.cache_dir
+        )
 
-    timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M")
+    timestamp = time.strftime("%Y%m%d_%H%M")
     results_dir = "results"
     os.makedirs(results_dir, exist_ok=True)
     csv_path = os.path.join(results_dir, f"scan_{timestamp}.csv")
     md_path = os.path.join(results_dir, f"scan_{timestamp}.md")
-    write_csv(csv_path, results)
-    write_markdown(md_path, results)
+    json_path = os.path.join(results_dir, f"scan_{timestamp}.json")
 
-    print(f"Saved CSV: {csv_path}")
-    print(f"Saved Markdown: {md_path}")
+    # executor.map yields in submission order, so CSV/Markdown rows stay
+    # deterministic; each CSV row is written as soon as its result is ready.
+    write_md = args.format != "csv"
+    keep_results = write_md or args.json
+    results: list[ScanResult] = []
+    jobs = min(args.jobs, len(tickers))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        scanned = executor.map(scan_one, tickers) if jobs > 1 else map(scan_one, tickers)
+        if tqdm is not None:
+            scanned = tqdm(scanned, total=len(tickers), desc="scanning", unit="ticker")
+        if args.format == "md":
+            results.extend(scanned)
+        else:
+            with StreamingCsvWriter(csv_path) as writer:
+                for result in scanned:
+                    writer.writerow(result)
+                    if keep_results:
+                        results.append(result)
+    if write_md:
+        write_markdown(md_path, results)
+    if args.json:
+        write_json(json_path, results)
+
+    if args.format != "md":
+        print(f"Saved CSV: {csv_path}")
+    if write_md:
+        print(f"Saved Markdown: {md_path}")
+    if args.json:
+        print(f"Saved JSON: {json_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+import itertools
+import unittest
+from decimal import Decimal
+
+from decision_engine.compile import compile_gates
+from decision_engine.demo import build_engine
+from decision_engine.engine import DecisionEngine
+from decision_engine.models import (
+    FinalDecision,
+    GateDecision,
+    GateResult,
+    MarketRegime,
+    MarketSnapshot,
+    PortfolioConstraints,
+    StockSnapshot,
+)
+from decision_engine.rules import GateRule, LiquidityGate, VolatilityGate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class OpaqueGate(GateRule):
+    name = "opaque_gate"
+
+    def evaluate(self, market, stock, regime):
+        return LiquidityGate().evaluate(market, stock, regime)
+
+
+class LenientLiquidityGate(LiquidityGate):
+    def evaluate(self, market, stock, regime):
+        return GateResult(self.name, GateDecision.PASS, self.pass_message)
+
+
+def interpret(gates, market, stock, regime):
+    reason_log = []
+    decision = GateDecision.PASS
+    for gate in gates:
+        result = gate.evaluate(market, stock, regime)
+        reason_log.append(result.message)
+        if result.decision == GateDecision.REJECT:
+            return GateDecision.REJECT, reason_log
+        if result.decision == GateDecision.WAIT:
+            decision = GateDecision.WAIT
+    return decision, reason_log
+
+
+class CompileGatesTests(unittest.TestCase):
+    def test_compiled_chain_matches_interpreted(self) -> None:
+        gates = build_engine().gates
+        compiled = compile_gates(gates)
+        self.assertIsNotNone(compiled)
+        market = MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
+        for avg_volume, volatility, flags, regime in itertools.product(
+            (100000, 500000),
+            (0.2, 0.6),
+            itertools.product((False, True), repeat=4),
+            MarketRegime,
+        ):
+            earnings_risk, regulatory_risk, business_clarity, sector_defensive = flags
+            stock = StockSnapshot(
+                ticker="GRID",
+                price=50,
+                avg_volume=avg_volume,
+                volume=avg_volume,
+                volatility_annual=volatility,
+                ma_50=50,
+                ma_200=45,
+                drawdown_6m=-0.1,
+                dividend_yield=0.0,
+                earnings_risk=earnings_risk,
+                regulatory_risk=regulatory_risk,
+                business_clarity=business_clarity,
+                sector_defensive=sector_defensive,
+            )
+            reason_log = []
+            decision = compiled(market, stock, regime, reason_log)
+            self.assertEqual((decision, reason_log), interpret(gates, market, stock, regime))
+
+    def test_identical_gate_sets_share_compiled_function(self) -> None:
+        first = compile_gates([LiquidityGate(), VolatilityGate(max_volatility=0.3)])
+        second = compile_gates([LiquidityGate(), VolatilityGate(max_volatility=0.3)])
+        self.assertIs(first, second)
+
+    def test_gate_without_ast_falls_back_to_interpreter(self) -> None:
+        self.assertIsNone(compile_gates([LiquidityGate(), OpaqueGate()]))
+        default = build_engine()
+        engine = DecisionEngine(
+            default.regime_rule,
+            [OpaqueGate()],
+            default.classifier,
+            default.entry_evaluator,
+            default.position_sizer,
+        )
+        self.assertIsNone(engine._compiled_gates)
+
+    def test_gate_overriding_only_evaluate_is_interpreted(self) -> None:
+        self.assertIsNone(compile_gates([LenientLiquidityGate()]))
+        default = build_engine()
+        engine = DecisionEngine(
+            default.regime_rule,
+            [LenientLiquidityGate()],
+            default.classifier,
+            default.entry_evaluator,
+            default.position_sizer,
+        )
+        market = MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
+        stock = StockSnapshot(
+            ticker="THIN",
+            price=50,
+            avg_volume=100,
+            volume=100,
+            volatility_annual=0.2,
+            ma_50=50,
+            ma_200=45,
+            drawdown_6m=-0.1,
+            dividend_yield=0.0,
+            earnings_risk=False,
+            regulatory_risk=False,
+            business_clarity=True,
+            sector_defensive=False,
+        )
+        constraints = PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02)
+        report = engine.evaluate(market, stock, constraints)
+        self.assertNotEqual(report.decision, FinalDecision.REJECT)
+
+    def assert_threshold_compiles(self, min_avg_volume) -> None:
+        gates = [LiquidityGate(min_avg_volume=min_avg_volume), VolatilityGate()]
+        compiled = compile_gates(gates)
+        self.assertIsNotNone(compiled)
+        market = MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
+        for avg_volume in (100000, 300000):
+            stock = StockSnapshot(
+                ticker="NUM",
+                price=50,
+                avg_volume=avg_volume,
+                volume=avg_volume,
+                volatility_annual=0.2,
+                ma_50=50,
+                ma_200=45,
+                drawdown_6m=-0.1,
+                dividend_yield=0.0,
+                earnings_risk=False,
+                regulatory_risk=False,
+                business_clarity=True,
+                sector_defensive=False,
+            )
+            reason_log = []
+            decision = compiled(market, stock, MarketRegime.RISK_ON, reason_log)
+            self.assertEqual((decision, reason_log), interpret(gates, market, stock, MarketRegime.RISK_ON))
+
+    def test_decimal_threshold_compiles(self) -> None:
+        self.assert_threshold_compiles(Decimal("200000"))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_threshold_compiles(self) -> None:
+        self.assert_threshold_compiles(np.percentile([100000.0, 300000.0], 50))
+        default = build_engine()
+        engine = DecisionEngine(
+            default.regime_rule,
+            [LiquidityGate(min_avg_volume=np.float64(200000))],
+            default.classifier,
+            default.entry_evaluator,
+            default.position_sizer,
+        )
+        self.assertIsNotNone(engine._compiled_gates)
+
+
+if __name__ == "__main__":
+    unittest.main()
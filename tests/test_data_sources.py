@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from decision_engine.data_sources import yfinance_source
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+class PickledFrame:
+    def to_pickle(self, path: str) -> None:
+        open(path, "wb").close()
+
+
+class FetchOhlcvCachedTests(unittest.TestCase):
+    def setUp(self) -> None:
+        yfinance_source.clear_ohlcv_cache()
+
+    def tearDown(self) -> None:
+        yfinance_source.clear_ohlcv_cache()
+
+    def test_successful_fetch_is_cached_per_ticker(self) -> None:
+        frame = object()
+        with patch.object(yfinance_source, "fetch_ohlcv", return_value=frame) as fetch:
+            self.assertIs(yfinance_source.fetch_ohlcv_cached("pg"), frame)
+            self.assertIs(yfinance_source.fetch_ohlcv_cached("PG"), frame)
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_refresh_replaces_memoized_frame(self) -> None:
+        stale, fresh = object(), object()
+        with patch.object(yfinance_source, "fetch_ohlcv", side_effect=[stale, fresh]):
+            yfinance_source.fetch_ohlcv_cached("PG")
+            self.assertIs(yfinance_source.fetch_ohlcv_cached("PG", refresh=True), fresh)
+        self.assertIs(yfinance_source.fetch_ohlcv_cached("PG"), fresh)
+
+    def test_disk_cache_stays_inside_cache_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = os.path.join(tmp_dir, "cache")
+            with patch.object(yfinance_source, "fetch_ohlcv", return_value=PickledFrame()):
+                yfinance_source.fetch_ohlcv_cached("../x", cache_dir=cache_dir)
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_disk_cache_prunes_earlier_days(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ohlcv_dir = os.path.join(cache_dir, "ohlcv")
+            os.mkdir(ohlcv_dir)
+            for path in (
+                os.path.join(ohlcv_dir, "PG_5y_2000-01-01.pkl"),
+                os.path.join(ohlcv_dir, "notes.txt"),
+                os.path.join(cache_dir, "KO_5y_2000-01-01.pkl"),
+            ):
+                open(path, "w").close()
+            with patch.object(yfinance_source, "fetch_ohlcv", return_value=PickledFrame()):
+                yfinance_source.fetch_ohlcv_cached("PG", cache_dir=cache_dir)
+            today = f"PG_5y_{yfinance_source.dt.date.today().isoformat()}.pkl"
+            self.assertEqual(sorted(os.listdir(ohlcv_dir)), sorted([today, "notes.txt"]))
+            # Files outside the cache's own subdirectory are never pruned.
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["KO_5y_2000-01-01.pkl", "ohlcv"])
+
+    def test_failed_fetch_is_not_cached(self) -> None:
+        with patch.object(yfinance_source, "fetch_ohlcv", return_value=None) as fetch:
+            self.assertIsNone(yfinance_source.fetch_ohlcv_cached("PG"))
+            self.assertIsNone(yfinance_source.fetch_ohlcv_cached("PG"))
+        self.assertEqual(fetch.call_count, 2)
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class FetchOhlcvManyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        yfinance_source.clear_ohlcv_cache()
+
+    def tearDown(self) -> None:
+        yfinance_source.clear_ohlcv_cache()
+
+    def fake_downloader(self, calls: list[str]):
+        def download(tickers: str, period: str, interval: str):
+            calls.append(tickers)
+            symbols = [symbol for symbol in tickers.split() if symbol != "BAD"]
+            index = pd.date_range("2024-01-01", periods=3)
+            columns = pd.MultiIndex.from_product([symbols, ["Close", "Volume"]])
+            frame = pd.DataFrame(1.0, index=index, columns=columns)
+            if "NEW" in symbols:
+                frame.loc[index[0], "NEW"] = float("nan")
+            return frame
+
+        return download
+
+    def test_chunks_requests_and_slices_per_ticker(self) -> None:
+        calls: list[str] = []
+        tickers = [f"T{index}" for index in range(25)] + ["NEW", "BAD"]
+        frames = yfinance_source.fetch_ohlcv_many(tickers, downloader=self.fake_downloader(calls))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(calls[0].split()), 20)
+        self.assertNotIn("BAD", frames)
+        self.assertEqual(list(frames["T0"].columns), ["Close", "Volume"])
+        self.assertEqual(len(frames["NEW"]), 2)
+
+    def test_memoized_tickers_are_not_requested_again(self) -> None:
+        calls: list[str] = []
+        downloader = self.fake_downloader(calls)
+        yfinance_source.fetch_ohlcv_many(["AAA", "BBB"], downloader=downloader)
+        frames = yfinance_source.fetch_ohlcv_many(["aaa", "CCC"], downloader=downloader)
+        self.assertEqual(calls, ["AAA BBB", "CCC"])
+        self.assertEqual(set(frames), {"AAA", "CCC"})
+        with patch.object(yfinance_source, "fetch_ohlcv") as fetch:
+            self.assertIsNotNone(yfinance_source.fetch_ohlcv_cached("BBB"))
+        fetch.assert_not_called()
+
+    def test_disk_cache_is_reused_by_later_runs(self) -> None:
+        calls: list[str] = []
+        downloader = self.fake_downloader(calls)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            yfinance_source.fetch_ohlcv_many(["AAA"], downloader=downloader, cache_dir=cache_dir)
+            yfinance_source.clear_ohlcv_cache()
+            frames = yfinance_source.fetch_ohlcv_many(["AAA", "BBB"], downloader=downloader, cache_dir=cache_dir)
+        self.assertEqual(calls, ["AAA", "BBB"])
+        self.assertEqual(list(frames["AAA"].columns), ["Close", "Volume"])
+
+
+if __name__ == "__main__":
+    unittest.main()
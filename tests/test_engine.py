@@ -1,9 +1,16 @@
+import logging
 import unittest
+from dataclasses import replace
 
+from decision_engine.demo import build_engine as default_engine
 from decision_engine.engine import DecisionEngine
 from decision_engine.indicators import IndicatorSnapshot
 from decision_engine.models import (
+    BUSINESS_CLARITY,
+    REGULATORY_RISK,
+    CandidateType,
     FinalDecision,
+    GateDecision,
     MarketRegime,
     MarketSnapshot,
     PortfolioConstraints,
@@ -79,6 +86,52 @@ class DecisionEngineTests(unittest.TestCase):
         report = self.engine.evaluate(self.market, stock, self.constraints)
         self.assertEqual(report.decision, FinalDecision.REJECT)
 
+    def test_default_gates_run_in_cost_hint_order(self) -> None:
+        names = [gate.name for gate in default_engine().gates]
+        self.assertEqual(
+            names,
+            [
+                "liquidity_gate",
+                "business_clarity_gate",
+                "event_risk_gate",
+                "volatility_gate",
+                "regime_mismatch_gate",
+            ],
+        )
+
+    def test_custom_gate_order_is_kept(self) -> None:
+        names = [gate.name for gate in self.engine.gates]
+        self.assertEqual(
+            names,
+            [
+                "liquidity_gate",
+                "volatility_gate",
+                "regime_mismatch_gate",
+                "event_risk_gate",
+                "business_clarity_gate",
+            ],
+        )
+
+    def test_gate_reject_skips_remaining_gates(self) -> None:
+        stock = StockSnapshot(
+            ticker="LOWVOL",
+            price=10,
+            avg_volume=500,
+            volume=500,
+            volatility_annual=0.9,
+            ma_50=9,
+            ma_200=8,
+            drawdown_6m=-0.1,
+            dividend_yield=0.0,
+            earnings_risk=True,
+            regulatory_risk=False,
+            business_clarity=True,
+            sector_defensive=False,
+        )
+        report = self.engine.evaluate(self.market, stock, self.constraints)
+        self.assertEqual(report.decision, FinalDecision.REJECT)
+        self.assertEqual(len(report.reason_log), 2)
+
     def test_gate_waits_on_event_risk(self) -> None:
         stock = StockSnapshot(
             ticker="EVT",
@@ -98,6 +151,48 @@ class DecisionEngineTests(unittest.TestCase):
         report = self.engine.evaluate(self.market, stock, self.constraints)
         self.assertEqual(report.decision, FinalDecision.WAIT)
 
+    def test_snapshot_flags_track_boolean_fields(self) -> None:
+        stock = StockSnapshot(
+            ticker="FLAG",
+            price=30,
+            avg_volume=200000,
+            volume=250000,
+            volatility_annual=0.2,
+            ma_50=28,
+            ma_200=25,
+            drawdown_6m=-0.1,
+            dividend_yield=0.0,
+            earnings_risk=False,
+            regulatory_risk=True,
+            business_clarity=True,
+            sector_defensive=False,
+        )
+        self.assertEqual(stock.flags, REGULATORY_RISK | BUSINESS_CLARITY)
+        cleared = replace(stock, regulatory_risk=False)
+        self.assertEqual(cleared.flags, BUSINESS_CLARITY)
+        result = EventRiskGate().evaluate(self.market, cleared, MarketRegime.RISK_ON)
+        self.assertEqual(result.decision, GateDecision.PASS)
+
+    def test_entry_evaluator_resolves_candidate_codes(self) -> None:
+        stock = StockSnapshot(
+            ticker="CODE",
+            price=52,
+            avg_volume=200000,
+            volume=260000,
+            volatility_annual=0.2,
+            ma_50=50,
+            ma_200=45,
+            drawdown_6m=-0.12,
+            dividend_yield=0.0,
+            earnings_risk=False,
+            regulatory_risk=False,
+            business_clarity=True,
+            sector_defensive=False,
+        )
+        evaluator = self.engine.entry_evaluator
+        for code, candidate_type in enumerate(CandidateType):
+            self.assertEqual(evaluator.evaluate_code(code, stock), evaluator.evaluate(candidate_type, stock))
+
     def test_classification_trend_pullback(self) -> None:
         stock = StockSnapshot(
             ticker="TP",
@@ -168,6 +263,12 @@ class DecisionEngineTests(unittest.TestCase):
             sector_defensive=False,
         )
         report = self.engine.evaluate(self.market, stock, self.constraints)
+        self.assertFalse(any("[DEF]" in item for item in report.reason_log))
+
+        logger = logging.getLogger("decision_engine.rules")
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.DEBUG)
+        report = self.engine.evaluate(self.market, stock, self.constraints)
         self.assertTrue(any("[DEF]" in item and "(FAIL)" in item for item in report.reason_log))
 
     def test_defensive_income_price_to_ma200_lower_bound_passes(self) -> None:
@@ -186,7 +287,7 @@ class DecisionEngineTests(unittest.TestCase):
             business_clarity=True,
             sector_defensive=False,
         )
-        result = DefensiveIncomeRule().evaluate(stock, MarketRegime.RISK_ON)
+        result = DefensiveIncomeRule(debug=True).evaluate(stock, MarketRegime.RISK_ON)
         self.assertTrue(result.passed)
         self.assertIn("price_to_ma200=0.970000", result.message)
         self.assertIn("within [0.969999, 1.120001]", result.message)
@@ -207,11 +308,33 @@ class DecisionEngineTests(unittest.TestCase):
             business_clarity=True,
             sector_defensive=False,
         )
-        result = DefensiveIncomeRule().evaluate(stock, MarketRegime.RISK_ON)
+        result = DefensiveIncomeRule(debug=True).evaluate(stock, MarketRegime.RISK_ON)
         self.assertTrue(result.passed)
         self.assertIn("price_to_ma200=1.120000", result.message)
         self.assertIn("within [0.969999, 1.120001]", result.message)
 
+    def test_defensive_income_omits_detail_lines_by_default(self) -> None:
+        stock = StockSnapshot(
+            ticker="DEFQUIET",
+            price=97.0,
+            avg_volume=1000.0,
+            volume=1000.0,
+            volatility_annual=0.4,
+            ma_50=97.0,
+            ma_200=100.0,
+            drawdown_6m=-0.1,
+            dividend_yield=0.0,
+            earnings_risk=False,
+            regulatory_risk=False,
+            business_clarity=True,
+            sector_defensive=False,
+        )
+        verbose = DefensiveIncomeRule(debug=True).evaluate(stock, MarketRegime.RISK_ON)
+        quiet = DefensiveIncomeRule().evaluate(stock, MarketRegime.RISK_ON)
+        self.assertEqual(quiet.passed, verbose.passed)
+        self.assertNotIn("[DEF]", quiet.message)
+        self.assertEqual(quiet.message, verbose.message.splitlines()[-1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,154 @@
+import random
+import unittest
+
+from decision_engine.demo import build_engine
+from decision_engine.engine import DecisionEngine
+from decision_engine.models import (
+    CandidateType,
+    FinalDecision,
+    MarketRegime,
+    MarketSnapshot,
+    PortfolioConstraints,
+    RuleResult,
+    StockSnapshot,
+    StockSnapshotBatch,
+)
+from decision_engine.rules import (
+    Classifier,
+    EntryEvaluator,
+    LiquidityGate,
+    RegimeRule,
+    TrendPullbackEntryRule,
+    TrendPullbackRule,
+    classify_regime_vectorized,
+)
+
+try:
+    import numpy as np
+
+    from decision_engine import engine_numba
+except ImportError:
+    np = None
+
+
+def random_stock(rng: random.Random, index: int) -> StockSnapshot:
+    ma_200 = rng.uniform(50, 150)
+    return StockSnapshot(
+        ticker=f"T{index}",
+        price=ma_200 * rng.uniform(0.6, 1.3),
+        avg_volume=rng.choice([100000, 500000, 2000000]),
+        volume=rng.uniform(100000, 3000000),
+        volatility_annual=rng.uniform(0.1, 0.6),
+        ma_50=ma_200 * rng.uniform(0.8, 1.2),
+        ma_200=ma_200,
+        drawdown_6m=rng.uniform(-0.45, 0.0),
+        dividend_yield=rng.uniform(0, 0.05),
+        earnings_risk=rng.random() < 0.1,
+        regulatory_risk=rng.random() < 0.05,
+        business_clarity=rng.random() < 0.95,
+        sector_defensive=rng.random() < 0.3,
+    )
+
+
+class RiskOffRegimeRule(RegimeRule):
+    def evaluate(self, market):
+        return MarketRegime.RISK_OFF, RuleResult(self.name, True, "항상 RISK_OFF.")
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class EvaluateBatchTests(unittest.TestCase):
+    def test_kernel_matches_interpreted_engine(self) -> None:
+        rng = random.Random(42)
+        engine = build_engine()
+        constraints = PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02)
+        stocks = [random_stock(rng, index) for index in range(500)]
+        batch = StockSnapshotBatch.from_rows(stocks)
+        markets = [
+            MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True),
+            MarketSnapshot(index_price=3800, index_ma_200=4000, vix=28, rate_trend_up=False),
+            MarketSnapshot(index_price=4050, index_ma_200=4000, vix=22, rate_trend_up=True),
+        ]
+        for market in markets:
+            decisions, candidates, positions = engine.evaluate_batch(market, batch, constraints)
+            for index, stock in enumerate(stocks):
+                report = engine.evaluate(market, stock, constraints)
+                self.assertEqual(engine_numba.DECISIONS[decisions[index]], report.decision, stock)
+                candidate_line = next((item for item in report.action_plan if item.startswith("후보 유형:")), None)
+                if candidates[index] == engine_numba.NO_CANDIDATE:
+                    self.assertIsNone(candidate_line)
+                else:
+                    self.assertIn(engine_numba.CANDIDATE_TYPES[candidates[index]].value, candidate_line)
+                    self.assertIn(f"비중 상한: {positions[index]:.2%}.", report.action_plan)
+
+    def test_rejects_custom_gate_sets(self) -> None:
+        default = build_engine()
+        engine = DecisionEngine(
+            default.regime_rule,
+            default.gates[:2],
+            default.classifier,
+            default.entry_evaluator,
+            default.position_sizer,
+        )
+        batch = StockSnapshotBatch.from_rows([random_stock(random.Random(1), 0)])
+        market = MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
+        constraints = PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02)
+        with self.assertRaises(ValueError):
+            engine.evaluate_batch(market, batch, constraints)
+
+    def test_rejects_engines_the_kernel_does_not_mirror(self) -> None:
+        default = build_engine()
+        parts = {
+            "regime_rule": default.regime_rule,
+            "gates": default.gates,
+            "classifier": default.classifier,
+            "entry_evaluator": default.entry_evaluator,
+            "position_sizer": default.position_sizer,
+        }
+        entry_rules = dict(default.entry_evaluator.rules)
+        entry_rules[CandidateType.DEFENSIVE_INCOME] = TrendPullbackEntryRule()
+        overrides = {
+            "custom regime rule": {"regime_rule": RiskOffRegimeRule()},
+            "duplicate gate": {"gates": [*default.gates, LiquidityGate(min_avg_volume=10**9)]},
+            "custom classifier rules": {"classifier": Classifier([TrendPullbackRule()])},
+            "custom entry rules": {"entry_evaluator": EntryEvaluator(entry_rules)},
+        }
+        stock = random_stock(random.Random(1), 0)
+        batch = StockSnapshotBatch.from_rows([stock])
+        market = MarketSnapshot(index_price=4200, index_ma_200=4000, vix=18, rate_trend_up=True)
+        constraints = PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02)
+        for label, override in overrides.items():
+            engine = DecisionEngine(**{**parts, **override})
+            with self.subTest(label), self.assertRaises(ValueError):
+                engine.evaluate_batch(market, batch, constraints)
+        # The second liquidity gate rejects every row, which the default
+        # kernel thresholds would not.
+        engine = DecisionEngine(**{**parts, **overrides["duplicate gate"]})
+        self.assertEqual(engine.evaluate(market, stock, constraints).decision, FinalDecision.REJECT)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ClassifyRegimeVectorizedTests(unittest.TestCase):
+    def test_matches_regime_rule(self) -> None:
+        rng = random.Random(3)
+        markets = [
+            MarketSnapshot(
+                index_price=rng.choice([3900, 4000, 4100]),
+                index_ma_200=4000,
+                vix=rng.choice([15, 20, 22, 25, 30]),
+                rate_trend_up=True,
+            )
+            for _ in range(200)
+        ]
+        codes = classify_regime_vectorized(
+            [market.index_price for market in markets],
+            [market.index_ma_200 for market in markets],
+            [market.vix for market in markets],
+        )
+        rule = RegimeRule()
+        for market, code in zip(markets, codes):
+            self.assertEqual(engine_numba.REGIMES[code], rule.evaluate(market)[0])
+            self.assertEqual(code, engine_numba.classify_regime_code(market.index_price, market.index_ma_200, market.vix))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import math
+import random
+import statistics
+import unittest
+import warnings
+from unittest.mock import patch
+
+from decision_engine import indicators
+from decision_engine._indicators_jit import compute_indicators
+from decision_engine._njit import NUMBA_AVAILABLE
+from decision_engine.indicators import IndicatorStream, build_indicators
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def build_history(length: int, seed: int = 7) -> tuple[list[float], list[float]]:
+    rng = random.Random(seed)
+    prices = [100.0]
+    for _ in range(length - 1):
+        prices.append(prices[-1] * (1 + rng.gauss(0, 0.02)))
+    volumes = [float(rng.randint(1000, 100000)) for _ in range(length)]
+    return prices, volumes
+
+
+class IndicatorAssertions(unittest.TestCase):
+    def assert_matches_history(self, snapshot, prices: list[float], volumes: list[float]) -> None:
+        self.assertIsNotNone(snapshot)
+        returns = [current / previous - 1 for previous, current in zip(prices[-21:-1], prices[-20:])]
+        volume_avg = statistics.fmean(volumes[-20:])
+        self.assertAlmostEqual(snapshot.latest_price, prices[-1])
+        self.assertAlmostEqual(snapshot.ma_20, statistics.fmean(prices[-20:]))
+        self.assertAlmostEqual(snapshot.ma_50, statistics.fmean(prices[-50:]))
+        self.assertAlmostEqual(snapshot.ma_60, statistics.fmean(prices[-60:]))
+        self.assertAlmostEqual(snapshot.ma_100, statistics.fmean(prices[-100:]))
+        self.assertAlmostEqual(snapshot.ma_200, statistics.fmean(prices[-200:]))
+        self.assertAlmostEqual(snapshot.volatility_20d, statistics.stdev(returns))
+        self.assertAlmostEqual(snapshot.volume_avg_20d, volume_avg)
+        self.assertAlmostEqual(snapshot.volume_change_ratio, volumes[-1] / volume_avg)
+        self.assertAlmostEqual(snapshot.drawdown_6m, prices[-1] / max(prices[-126:]) - 1)
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class BuildIndicatorsTests(IndicatorAssertions):
+    def test_matches_reference_calculation(self) -> None:
+        prices, volumes = build_history(300)
+        data = pd.DataFrame({"Close": prices, "Volume": volumes})
+        self.assert_matches_history(build_indicators(data), prices, volumes)
+
+    def test_missing_rows_are_dropped(self) -> None:
+        prices, volumes = build_history(300)
+        data = pd.DataFrame({"Close": prices + [math.nan], "Volume": volumes + [math.nan]})
+        self.assert_matches_history(build_indicators(data), prices, volumes)
+
+    def test_zero_price_in_window_returns_none(self) -> None:
+        prices, volumes = build_history(260)
+        prices[250] = 0.0
+        self.assertIsNone(build_indicators(pd.DataFrame({"Close": prices, "Volume": volumes})))
+
+    def test_zero_price_is_silent_on_numpy_path(self) -> None:
+        prices, volumes = build_history(260)
+        prices[250] = 0.0
+        with patch.object(indicators, "_get_indicator_kernel", return_value=indicators._indicator_values):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                self.assertIsNone(build_indicators(pd.DataFrame({"Close": prices, "Volume": volumes})))
+
+    def test_short_history_returns_none(self) -> None:
+        prices, volumes = build_history(150)
+        self.assertIsNone(build_indicators(pd.DataFrame({"Close": prices, "Volume": volumes})))
+
+
+class IndicatorStreamTests(IndicatorAssertions):
+    def test_requires_full_history(self) -> None:
+        prices, volumes = build_history(199)
+        self.assertIsNone(IndicatorStream(prices, volumes).snapshot())
+
+    def test_incremental_updates_match_recomputation(self) -> None:
+        prices, volumes = build_history(400)
+        stream = IndicatorStream(prices[:250], volumes[:250])
+        self.assert_matches_history(stream.snapshot(), prices[:250], volumes[:250])
+        for index in range(250, 400):
+            stream.push(prices[index], volumes[index])
+        self.assert_matches_history(stream.snapshot(), prices, volumes)
+
+    def test_nan_bars_are_skipped(self) -> None:
+        prices, volumes = build_history(260)
+        stream = IndicatorStream(prices, volumes)
+        stream.push(math.nan, math.nan)
+        self.assert_matches_history(stream.snapshot(), prices, volumes)
+
+
+class ComputeIndicatorsTests(unittest.TestCase):
+    def test_kernel_matches_reference_calculation(self) -> None:
+        prices, volumes = build_history(300)
+        prices, volumes = prices[-200:], volumes[-20:]
+        ma_20, ma_50, ma_60, ma_100, ma_200, volatility, volume_avg, drawdown = compute_indicators(
+            prices, volumes, indicators._MA_WINDOWS, indicators._VOLATILITY_WINDOW, indicators._DRAWDOWN_WINDOW
+        )
+        returns = [current / previous - 1 for previous, current in zip(prices[-21:-1], prices[-20:])]
+        self.assertAlmostEqual(ma_20, statistics.fmean(prices[-20:]))
+        self.assertAlmostEqual(ma_50, statistics.fmean(prices[-50:]))
+        self.assertAlmostEqual(ma_60, statistics.fmean(prices[-60:]))
+        self.assertAlmostEqual(ma_100, statistics.fmean(prices[-100:]))
+        self.assertAlmostEqual(ma_200, statistics.fmean(prices))
+        self.assertAlmostEqual(volatility, statistics.stdev(returns))
+        self.assertAlmostEqual(volume_avg, statistics.fmean(volumes))
+        self.assertAlmostEqual(drawdown, prices[-1] / max(prices[-126:]) - 1)
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "the interpreted kernel is never called on this path")
+    def test_zero_price_yields_nan_volatility(self) -> None:
+        prices, volumes = build_history(200)
+        prices[190] = 0.0
+        volatility = compute_indicators(
+            prices, volumes[-20:], indicators._MA_WINDOWS, indicators._VOLATILITY_WINDOW, indicators._DRAWDOWN_WINDOW
+        )[5]
+        self.assertTrue(math.isnan(volatility))
+
+
+class FakeFrame:
+    def __init__(self, index: list[int]) -> None:
+        self.index = index
+
+
+class BuildIndicatorsCachedTests(unittest.TestCase):
+    def setUp(self) -> None:
+        indicators.clear_indicator_cache()
+
+    def tearDown(self) -> None:
+        indicators.clear_indicator_cache()
+
+    def test_same_frame_is_computed_once(self) -> None:
+        frame = FakeFrame([1, 2, 3])
+        with patch.object(indicators, "build_indicators", return_value="snapshot") as build:
+            self.assertEqual(indicators.build_indicators_cached(frame), "snapshot")
+            self.assertEqual(indicators.build_indicators_cached(frame), "snapshot")
+            indicators.build_indicators_cached(frame, use_adjusted_close=True)
+        self.assertEqual(build.call_count, 2)
+
+    def test_grown_frame_is_recomputed(self) -> None:
+        frame = FakeFrame([1, 2, 3])
+        with patch.object(indicators, "build_indicators", return_value="snapshot") as build:
+            indicators.build_indicators_cached(frame)
+            frame.index = [1, 2, 3, 4]
+            indicators.build_indicators_cached(frame)
+        self.assertEqual(build.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,26 @@
 import io
+import json
 import unittest
 from contextlib import redirect_stdout
 from unittest.mock import patch
 
 from decision_engine import run
+from decision_engine.indicators import IndicatorSnapshot
+
+INDICATORS = IndicatorSnapshot(
+    price_column="Close",
+    latest_price=100.0,
+    latest_volume=1000.0,
+    ma_20=100.0,
+    ma_50=100.0,
+    ma_60=100.0,
+    ma_100=100.0,
+    ma_200=95.0,
+    volatility_20d=0.01,
+    volume_avg_20d=1000.0,
+    volume_change_ratio=1.0,
+    drawdown_6m=-0.05,
+)
 
 
 class DecisionEngineRunTests(unittest.TestCase):
@@ -27,6 +44,57 @@ class DecisionEngineRunTests(unittest.TestCase):
         self.assertIn("WAIT", output)
         self.assertIn("라이브 데이터", output)
 
+    def test_report_to_json_payload(self) -> None:
+        report = run.DecisionReport(run.FinalDecision.WAIT, ["이유"], ["계획"])
+        payload = json.loads(run.report_to_json(report, "PG", run.MarketRegime.RISK_OFF))
+        self.assertEqual(
+            payload,
+            {
+                "decision": "WAIT",
+                "reason_log": ["이유"],
+                "action_plan": ["계획"],
+                "ticker": "PG",
+                "market_regime_override": "RISK_OFF",
+            },
+        )
+
+    def test_report_to_json_matches_stdlib_encoder(self) -> None:
+        report = run.DecisionReport(run.FinalDecision.APPROVE, ["이유", "둘째"], [])
+        with patch.object(run, "orjson", None):
+            expected = run.report_to_json(report, "PG", None)
+        self.assertEqual(run.report_to_json(report, "PG", None), expected)
+
+    def test_default_engine_is_shared(self) -> None:
+        self.assertIs(run.get_default_engine(), run.get_default_engine())
+
+
+class LiveSnapshotCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        run.clear_live_snapshot_cache()
+
+    def tearDown(self) -> None:
+        run.clear_live_snapshot_cache()
+
+    def test_snapshot_is_reused_until_ttl_expires(self) -> None:
+        with patch("decision_engine.data_sources.yfinance_source.fetch_ohlcv_cached", return_value=object()) as fetch:
+            with patch.object(run, "build_indicators_cached", return_value=INDICATORS):
+                first, _ = run.build_live_stock_snapshot("pg")
+                second, _ = run.build_live_stock_snapshot("PG")
+                with patch.object(run.time, "monotonic", return_value=run.time.monotonic() + run._LIVE_SNAPSHOT_TTL):
+                    run.build_live_stock_snapshot("PG")
+        self.assertIs(first, second)
+        self.assertEqual(fetch.call_count, 2)
+        # The expired rebuild must bypass the per-day OHLCV memo.
+        self.assertEqual([call.kwargs["refresh"] for call in fetch.call_args_list], [False, True])
+
+    def test_failed_snapshot_is_not_cached(self) -> None:
+        with patch("decision_engine.data_sources.yfinance_source.fetch_ohlcv_cached", return_value=None) as fetch:
+            run.build_live_stock_snapshot("PG")
+            stock, reason = run.build_live_stock_snapshot("PG")
+        self.assertIsNone(stock)
+        self.assertIsNotNone(reason)
+        self.assertEqual(fetch.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,18 @@
 import csv
+import json
 import os
 import tempfile
 import unittest
 from contextlib import contextmanager
+from unittest.mock import patch
 
-from decision_engine import scan
+from decision_engine import run, scan
+from decision_engine.indicators import IndicatorSnapshot
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 
 @contextmanager
@@ -34,6 +42,126 @@ class DecisionEngineScanTests(unittest.TestCase):
                     rows = list(csv.DictReader(handle))
                 self.assertEqual(len(rows), 3)
 
+    def test_parallel_scan_preserves_ticker_order(self) -> None:
+        tickers = "PG,TSLA,MSFT,ABC,XYZ"
+        outputs = []
+        for jobs in ("1", "4"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                with chdir(tmp_dir):
+                    scan.main(["--mode", "sample", "--tickers", tickers, "--jobs", jobs])
+                    results_dir = os.path.join(tmp_dir, "results")
+                    csv_file = next(name for name in os.listdir(results_dir) if name.endswith(".csv"))
+                    with open(os.path.join(results_dir, csv_file), newline="", encoding="utf-8") as handle:
+                        outputs.append(list(csv.DictReader(handle)))
+        self.assertEqual([row["ticker"] for row in outputs[1]], tickers.split(","))
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_format_selects_written_files(self) -> None:
+        for output_format, suffixes in (("csv", {".csv"}), ("md", {".md"}), ("both", {".csv", ".md"})):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                with chdir(tmp_dir):
+                    scan.main(["--mode", "sample", "--tickers", "PG,TSLA", "--format", output_format])
+                    written = {os.path.splitext(name)[1] for name in os.listdir("results")}
+            self.assertEqual(written, suffixes)
+
+    def test_json_output_matches_csv_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with chdir(tmp_dir):
+                scan.main(["--mode", "sample", "--tickers", "PG,TSLA", "--format", "csv", "--json"])
+                names = sorted(os.listdir("results"))
+                with open(os.path.join("results", names[0]), newline="", encoding="utf-8") as handle:
+                    rows = list(csv.DictReader(handle))
+                with open(os.path.join("results", names[1]), encoding="utf-8") as handle:
+                    payload = json.load(handle)
+        self.assertEqual([name.rsplit(".", 1)[1] for name in names], ["csv", "json"])
+        self.assertEqual([{key: value or "" for key, value in row.items()} for row in payload], rows)
+
+    def test_write_json_matches_stdlib_encoder(self) -> None:
+        results = [scan._data_wait_result("PG", "데이터 없음")]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fast_path = os.path.join(tmp_dir, "fast.json")
+            stdlib_path = os.path.join(tmp_dir, "stdlib.json")
+            scan.write_json(fast_path, results)
+            with patch.object(scan, "orjson", None):
+                scan.write_json(stdlib_path, results)
+            with open(fast_path, encoding="utf-8") as fast, open(stdlib_path, encoding="utf-8") as stdlib:
+                self.assertEqual(json.load(fast), json.load(stdlib))
+
+    def test_live_scan_prefetches_tickers_in_one_batch(self) -> None:
+        run.clear_live_snapshot_cache()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with chdir(tmp_dir), patch.object(scan.yfinance_source, "fetch_ohlcv_many") as fetch_many:
+                with patch.object(scan.yfinance_source, "fetch_ohlcv", return_value=None):
+                    scan.main(["--mode", "live", "--tickers", "aapl,msft"])
+        fetch_many.assert_called_once_with(["AAPL", "MSFT"], cache_dir=None, refresh=[])
+
+    def test_live_scan_skips_malformed_tickers(self) -> None:
+        run.clear_live_snapshot_cache()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with chdir(tmp_dir), patch.object(scan.yfinance_source, "fetch_ohlcv_many") as fetch_many:
+                with patch.object(scan.yfinance_source, "fetch_ohlcv", return_value=None) as fetch:
+                    scan.main(["--mode", "live", "--tickers", "brk-b,$$$,m&m.ns", "--format", "csv"])
+                csv_file = next(name for name in os.listdir("results") if name.endswith(".csv"))
+                with open(os.path.join("results", csv_file), newline="", encoding="utf-8") as handle:
+                    rows = list(csv.DictReader(handle))
+        fetch_many.assert_called_once_with(["BRK-B", "M&M.NS"], cache_dir=None, refresh=[])
+        self.assertEqual([call.args[0] for call in fetch.call_args_list], ["BRK-B", "M&M.NS"])
+        self.assertEqual(rows[1]["block_stage"], "DATA")
+        self.assertIn("종목 코드", rows[1]["wait_reason_top"])
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_repeat_live_scan_refreshes_expired_tickers_in_one_batch(self) -> None:
+        batch_calls: list[str] = []
+        single_calls: list[str] = []
+
+        def download_batch(tickers: str, period: str, interval: str):
+            batch_calls.append(tickers)
+            columns = pd.MultiIndex.from_product([tickers.split(), ["Close", "Volume"]])
+            return pd.DataFrame(1.0, index=pd.date_range("2024-01-01", periods=3), columns=columns)
+
+        def download_single(ticker: str, period: str, interval: str):
+            single_calls.append(ticker)
+            return None
+
+        indicators = IndicatorSnapshot(
+            price_column="Close",
+            latest_price=100.0,
+            latest_volume=1000.0,
+            ma_20=100.0,
+            ma_50=100.0,
+            ma_60=100.0,
+            ma_100=100.0,
+            ma_200=95.0,
+            volatility_20d=0.01,
+            volume_avg_20d=1000.0,
+            volume_change_ratio=1.0,
+            drawdown_6m=-0.05,
+        )
+        run.clear_live_snapshot_cache()
+        scan.yfinance_source.clear_ohlcv_cache()
+        self.addCleanup(run.clear_live_snapshot_cache)
+        self.addCleanup(scan.yfinance_source.clear_ohlcv_cache)
+        later = run.time.monotonic() + run._LIVE_SNAPSHOT_TTL + 600
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with chdir(tmp_dir), patch.object(run, "build_indicators_cached", return_value=indicators):
+                with patch.object(scan.yfinance_source, "_default_batch_downloader", download_batch), patch.object(
+                    scan.yfinance_source, "_default_downloader", download_single
+                ):
+                    scan.main(["--mode", "live", "--tickers", "aapl,msft,ko", "--format", "csv"])
+                    self.assertEqual((batch_calls, single_calls), (["AAPL MSFT KO"], []))
+                    with patch.object(run.time, "monotonic", return_value=later):
+                        scan.main(["--mode", "live", "--tickers", "aapl,msft,ko", "--format", "csv"])
+        self.assertEqual(batch_calls, ["AAPL MSFT KO", "AAPL MSFT KO"])
+        self.assertEqual(single_calls, [])
+
+    def test_load_tickers_from_file_or_list(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tickers.txt")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("aapl\n\nMSFT\nAapl\n ko \n")
+            self.assertEqual(scan.load_tickers(path), ["AAPL", "MSFT", "KO"])
+        self.assertEqual(scan.load_tickers("pg, tsla,PG,,msft"), ["PG", "TSLA", "MSFT"])
+
     def test_wait_reason_prefers_blocking_candidate(self) -> None:
         reason_log = [
             "이벤트 리스크 없음.",
@@ -42,6 +170,20 @@ class DecisionEngineScanTests(unittest.TestCase):
         reason = scan.summarize_wait_reason(reason_log)
         self.assertEqual(reason, "연율 변동성이 높아 과도한 변동성으로 보류.")
 
+    def test_multi_gate_wait_reports_last_gate_in_cost_order(self) -> None:
+        # TSLA trips both the event-risk and volatility gates; the default chain
+        # runs volatility later, so its message is the reported WAIT reason.
+        result = scan.evaluate_ticker(
+            run.get_default_engine(),
+            "TSLA",
+            "sample",
+            run.PortfolioConstraints(max_position_pct=0.08, tranche_count=3, max_risk_pct=0.02),
+            run.build_market_snapshot(None),
+            False,
+        )
+        self.assertEqual(result.decision, "WAIT")
+        self.assertEqual(result.wait_reason_top, "연율 변동성이 높아 과도한 변동성으로 보류.")
+
     def test_block_stage_entry_trigger_with_event_safe(self) -> None:
         reason_log = [
             "이벤트 리스크 없음.",